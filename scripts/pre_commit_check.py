@@ -49,7 +49,9 @@ def main():
 
     # Run pytest if tests directory exists
     if Path("tests").exists():
-        checks.append(("poetry run pytest tests/ -x", "Unit tests"))
+        checks.append(
+            ('poetry run pytest tests/ -x -n auto -m "not integration"', "Unit tests")
+        )
 
     all_passed = True
     for command, description in checks:
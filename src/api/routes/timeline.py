@@ -174,6 +174,9 @@ def create_timeline_router(
 
             return TimelineResponse.from_domain(timeline_response)
 
+        except HTTPException:
+            # Date parsing errors above already carry their 400 response
+            raise
         except TimelineQueryError as e:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
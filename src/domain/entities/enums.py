@@ -1,6 +1,7 @@
 """Enums for the Personal Semantic Engine domain."""
 
 from enum import Enum, auto
+from typing import Optional
 
 
 class EntityType(str, Enum):
@@ -13,3 +14,18 @@ class EntityType(str, Enum):
     EMOTION = "emotion"
     ORGANIZATION = "organization"
     EVENT = "event"
+
+    @classmethod
+    def from_str(cls, value: str) -> Optional["EntityType"]:
+        """Look up an entity type by its value.
+
+        Args:
+            value: The entity type value, e.g. "person"
+
+        Returns:
+            The matching entity type, or None if the value is not a known type
+        """
+        return _ENTITY_TYPES_BY_VALUE.get(value)
+
+
+_ENTITY_TYPES_BY_VALUE = {entity_type.value: entity_type for entity_type in EntityType}
@@ -1,9 +1,9 @@
 """Search query value objects for the Personal Semantic Engine."""
 
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import List, Optional, Union
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
 from src.domain.entities.enums import EntityType
 
@@ -14,15 +14,16 @@ class DateRange(BaseModel):
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
 
-    @validator("end_date")
+    @field_validator("end_date")
+    @classmethod
     def end_date_after_start_date(
-        cls, v: Optional[datetime], values: Dict
+        cls, v: Optional[datetime], info: ValidationInfo
     ) -> Optional[datetime]:
         """Validate that end_date is after start_date if both are provided.
 
         Args:
             v: The end_date to validate
-            values: The values dict containing start_date
+            info: Validation info whose data holds the validated start_date
 
         Returns:
             The validated end_date
@@ -30,8 +31,9 @@ class DateRange(BaseModel):
         Raises:
             ValueError: If end_date is before start_date
         """
-        if v is not None and values.get("start_date") is not None:
-            if v < values["start_date"]:
+        start_date = info.data.get("start_date")
+        if v is not None and start_date is not None:
+            if v < start_date:
                 raise ValueError("end_date must be after start_date")
         return v
 
@@ -49,7 +51,8 @@ class SortOptions(BaseModel):
     sort_by: str = "relevance"  # Options: relevance, date, confidence
     sort_order: str = "desc"  # Options: asc, desc
 
-    @validator("sort_by")
+    @field_validator("sort_by")
+    @classmethod
     def validate_sort_by(cls, v: str) -> str:
         """Validate that sort_by is one of the allowed values.
 
@@ -67,7 +70,8 @@ class SortOptions(BaseModel):
             raise ValueError(f"sort_by must be one of {allowed_values}")
         return v
 
-    @validator("sort_order")
+    @field_validator("sort_order")
+    @classmethod
     def validate_sort_order(cls, v: str) -> str:
         """Validate that sort_order is one of the allowed values.
 
@@ -105,7 +109,8 @@ class SearchQuery(BaseModel):
     include_raw_content: bool = True
     highlight_matches: bool = True
 
-    @validator("query_text")
+    @field_validator("query_text")
+    @classmethod
     def query_text_not_empty(cls, v: str) -> str:
         """Validate that the query text is not empty.
 
@@ -122,7 +127,4 @@ class SearchQuery(BaseModel):
             raise ValueError("Search query text cannot be empty")
         return v
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True  # Immutable objects
+    model_config = ConfigDict(frozen=True)  # Immutable objects
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.domain.entities.semantic_entry import SemanticEntry
 from src.domain.entities.thought import Thought
@@ -39,10 +39,7 @@ class SearchResult(BaseModel):
     score: SearchScore
     rank: int  # Position in the search results (1-based)
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True  # Immutable objects
+    model_config = ConfigDict(frozen=True)  # Immutable objects
 
 
 class SearchResponse(BaseModel):
@@ -56,7 +53,4 @@ class SearchResponse(BaseModel):
     search_time_ms: int
     suggestions: List[str] = Field(default_factory=list)
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True  # Immutable objects
\ No newline at end of file
+    model_config = ConfigDict(frozen=True)  # Immutable objects
\ No newline at end of file
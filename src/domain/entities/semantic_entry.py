@@ -1,13 +1,25 @@
 """Semantic entry domain entity for the Personal Semantic Engine."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, Any, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    ValidatorFunctionWrapHandler,
+    field_validator,
+)
 
 from src.domain.entities.enums import EntityType
 
+# A score in [0, 1], checked by pydantic-core rather than a Python validator
+UnitInterval = Annotated[float, Field(ge=0.0, le=1.0)]
+
+_RANGE_ERRORS = frozenset({"greater_than_equal", "less_than_equal"})
+
 
 class Relationship(BaseModel):
     """A relationship between two semantic entries."""
@@ -16,13 +28,10 @@ class Relationship(BaseModel):
     source_entity_id: UUID
     target_entity_id: UUID
     relationship_type: str
-    strength: float = Field(ge=0.0, le=1.0)
+    strength: UnitInterval
     created_at: datetime = Field(default_factory=datetime.now)
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True  # Immutable objects
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class SemanticEntry(BaseModel):
@@ -32,13 +41,14 @@ class SemanticEntry(BaseModel):
     thought_id: UUID
     entity_type: EntityType
     entity_value: str
-    confidence: float = Field(ge=0.0, le=1.0)
+    confidence: UnitInterval
     context: str
     relationships: List[Relationship] = Field(default_factory=list)
     embedding: Optional[List[float]] = None
     extracted_at: datetime = Field(default_factory=datetime.now)
 
-    @validator("entity_value")
+    @field_validator("entity_value")
+    @classmethod
     def entity_value_not_empty(cls, v: str) -> str:
         """Validate that the entity value is not empty.
 
@@ -55,12 +65,19 @@ class SemanticEntry(BaseModel):
             raise ValueError("Entity value cannot be empty")
         return v
 
-    @validator("confidence")
-    def confidence_in_range(cls, v: float) -> float:
+    @field_validator("confidence", mode="wrap")
+    @classmethod
+    def confidence_in_range(
+        cls, v: Any, handler: ValidatorFunctionWrapHandler
+    ) -> float:
         """Validate that the confidence is between 0 and 1.
 
+        The bound itself is enforced by the field schema; this only replaces
+        the generic range error with a domain-specific message.
+
         Args:
             v: The confidence to validate
+            handler: The schema validator for the field
 
         Returns:
             The validated confidence
@@ -68,11 +85,11 @@ class SemanticEntry(BaseModel):
         Raises:
             ValueError: If the confidence is not between 0 and 1
         """
-        if not 0 <= v <= 1:
-            raise ValueError("Confidence must be between 0 and 1")
-        return v
-
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True  # Immutable objects
+        try:
+            return handler(v)
+        except ValidationError as e:
+            if any(error["type"] in _RANGE_ERRORS for error in e.errors()):
+                raise ValueError("Confidence must be between 0 and 1")
+            raise
+
+    model_config = ConfigDict(frozen=True)  # Immutable objects
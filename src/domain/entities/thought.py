@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from src.domain.entities.semantic_entry import SemanticEntry
 
@@ -16,6 +16,8 @@ class GeoLocation(BaseModel):
     longitude: float
     name: Optional[str] = None
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class WeatherData(BaseModel):
     """Weather information."""
@@ -24,6 +26,8 @@ class WeatherData(BaseModel):
     condition: Optional[str] = None
     humidity: Optional[float] = None
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class ThoughtMetadata(BaseModel):
     """Metadata associated with a thought."""
@@ -34,6 +38,8 @@ class ThoughtMetadata(BaseModel):
     tags: List[str] = Field(default_factory=list)
     custom: Dict[str, str] = Field(default_factory=dict)
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
 
 class Thought(BaseModel):
     """A user's thought or note with associated metadata and semantic entries."""
@@ -47,7 +53,8 @@ class Thought(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
-    @validator("content")
+    @field_validator("content")
+    @classmethod
     def content_not_empty(cls, v: str) -> str:
         """Validate that the thought content is not empty.
 
@@ -64,7 +71,4 @@ class Thought(BaseModel):
             raise ValueError("Thought content cannot be empty")
         return v
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True  # Immutable objects
+    model_config = ConfigDict(frozen=True)  # Immutable objects
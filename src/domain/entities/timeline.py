@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
 from src.domain.entities.enums import EntityType
 from src.domain.entities.semantic_entry import SemanticEntry
@@ -17,20 +17,19 @@ class DateRange(BaseModel):
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
 
-    @validator("end_date")
+    @field_validator("end_date")
+    @classmethod
     def end_date_after_start_date(
-        cls, v: Optional[datetime], values: Dict
+        cls, v: Optional[datetime], info: ValidationInfo
     ) -> Optional[datetime]:
         """Validate that end_date is after start_date if both are provided."""
-        if v is not None and values.get("start_date") is not None:
-            if v < values["start_date"]:
+        start_date = info.data.get("start_date")
+        if v is not None and start_date is not None:
+            if v < start_date:
                 raise ValueError("end_date must be after start_date")
         return v
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
 
 class TimelineFilter(BaseModel):
@@ -41,10 +40,7 @@ class TimelineFilter(BaseModel):
     data_sources: List[str] = Field(default_factory=list)
     tags: List[str] = Field(default_factory=list)
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
 
 class Pagination(BaseModel):
@@ -53,10 +49,7 @@ class Pagination(BaseModel):
     page: int = Field(1, ge=1)
     page_size: int = Field(20, ge=1, le=100)
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
 
 class TimelineQuery(BaseModel):
@@ -67,17 +60,15 @@ class TimelineQuery(BaseModel):
     pagination: Optional[Pagination] = None
     sort_order: str = Field("desc", pattern="^(asc|desc)$")
 
-    @validator("user_id")
+    @field_validator("user_id")
+    @classmethod
     def user_id_not_empty(cls, v: str) -> str:
         """Validate that user_id is not empty."""
         if not v.strip():
             raise ValueError("User ID cannot be empty")
         return v
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
 
 class EntityConnection(BaseModel):
@@ -89,10 +80,7 @@ class EntityConnection(BaseModel):
     confidence: float = Field(ge=0.0, le=1.0)
     relationship_type: Optional[str] = None
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
 
 class TimelineEntry(BaseModel):
@@ -106,10 +94,7 @@ class TimelineEntry(BaseModel):
     grouped_with: List[UUID] = Field(default_factory=list)  # IDs of related entries
     data_source: str = "thought"  # For future external API integrations
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
 
 class TimelineGroup(BaseModel):
@@ -122,10 +107,7 @@ class TimelineGroup(BaseModel):
     common_entities: List[EntityConnection] = Field(default_factory=list)
     summary: Optional[str] = None
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
 
 class TimelineSummary(BaseModel):
@@ -137,10 +119,7 @@ class TimelineSummary(BaseModel):
     most_active_periods: List[Dict[str, str]] = Field(default_factory=list)
     top_entities: List[Dict[str, str]] = Field(default_factory=list)
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True
+    model_config = ConfigDict(frozen=True)
 
 
 class TimelineResponse(BaseModel):
@@ -155,7 +134,4 @@ class TimelineResponse(BaseModel):
     has_previous: bool
     summary: Optional[TimelineSummary] = None
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True
\ No newline at end of file
+    model_config = ConfigDict(frozen=True)
\ No newline at end of file
@@ -1,17 +1,21 @@
 """User domain entity for the Personal Semantic Engine."""
 
+import re
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+
+# Structural check only; API models that need RFC validation use EmailStr
+_EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
 class User(BaseModel):
     """A user of the Personal Semantic Engine."""
 
     id: UUID
-    email: EmailStr
+    email: Annotated[str, StringConstraints(strip_whitespace=True)]
     hashed_password: str
     is_active: bool = True
     is_admin: bool = False
@@ -19,24 +23,28 @@ class User(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now)
     last_login: Optional[datetime] = None
 
-    @validator("email")
-    def email_not_empty(cls, v: str) -> str:
-        """Validate that the email is not empty.
+    @field_validator("email")
+    @classmethod
+    def email_valid(cls, v: str) -> str:
+        """Validate that the email is not empty and looks like an address.
+
+        The domain is lowercased, as EmailStr did, so addresses that differ
+        only in domain case identify the same user.
 
         Args:
             v: The email to validate
 
         Returns:
-            The validated email
+            The validated email with a normalized domain
 
         Raises:
-            ValueError: If the email is empty
+            ValueError: If the email is empty or malformed
         """
-        if not v.strip():
+        if not v:
             raise ValueError("Email cannot be empty")
-        return v
-
-    class Config:
-        """Pydantic configuration."""
+        if not _EMAIL_PATTERN.match(v):
+            raise ValueError("Invalid email address")
+        local_part, _, domain = v.rpartition("@")
+        return f"{local_part}@{domain.lower()}"
 
-        frozen = True  # Immutable objects
+    model_config = ConfigDict(frozen=True)  # Immutable objects
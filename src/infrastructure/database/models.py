@@ -109,7 +109,7 @@ class Thought(Base):
         location = None
         if metadata_dict.get("location"):
             loc_data = metadata_dict["location"]
-            location = GeoLocation(
+            location = GeoLocation.model_construct(
                 latitude=loc_data.get("latitude"),
                 longitude=loc_data.get("longitude"),
                 name=loc_data.get("name"),
@@ -119,14 +119,14 @@ class Thought(Base):
         weather = None
         if metadata_dict.get("weather"):
             weather_data = metadata_dict["weather"]
-            weather = WeatherData(
+            weather = WeatherData.model_construct(
                 temperature=weather_data.get("temperature"),
                 condition=weather_data.get("condition"),
                 humidity=weather_data.get("humidity"),
             )
 
-        # Create metadata object
-        metadata = ThoughtMetadata(
+        # Stored metadata was validated when it was saved, so skip revalidation
+        metadata = ThoughtMetadata.model_construct(
             location=location,
             weather=weather,
             mood=metadata_dict.get("mood"),
@@ -1,6 +1,6 @@
 """LLM infrastructure package."""
 
-from .entity_extraction_service import LLMEntityExtractionService
+from .entity_extraction_service import LLMEntityExtractionService, PromptSet
 from .llm_service import LLMService
 
-__all__ = ["LLMService", "LLMEntityExtractionService"]
+__all__ = ["LLMService", "LLMEntityExtractionService", "PromptSet"]
@@ -2,13 +2,16 @@
 
 import json
 import os
+import re
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from src.domain.entities.enums import EntityType
-from src.domain.entities.semantic_entry import Relationship, SemanticEntry
+from src.domain.entities.semantic_entry import SemanticEntry
 from src.domain.entities.thought import ThoughtMetadata
 from src.domain.exceptions import EntityExtractionError
 from src.domain.services.entity_extraction_service import EntityExtractionService
@@ -16,6 +19,53 @@ from src.infrastructure.llm.llm_service import LLMService
 from src.infrastructure.logging import LoggerMixin, log_function_call, log_external_api_call
 from src.infrastructure.retry import llm_retry
 
+# Built once at import time; constructing a TypeAdapter compiles its validator
+_ENTRY_LIST_ADAPTER = TypeAdapter(List[SemanticEntry])
+
+
+# Only these placeholders are substituted; any other braces in a template
+# (JSON examples, "{}", "{{...}}") are kept verbatim
+_PROMPT_PLACEHOLDER = re.compile(r"\{(CONTENT|METADATA)\}")
+
+
+class _RawRelationship(BaseModel):
+    """A relationship as returned by the LLM."""
+
+    target_id: Optional[str] = None
+    type: str = "related_to"
+    strength: float = 0.9
+
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+
+class _RawEntity(BaseModel):
+    """An entity as returned by the LLM."""
+
+    id: Optional[str] = None
+    type: str
+    value: str
+    confidence: float = 0.9
+    context: str = ""
+    relationships: List[_RawRelationship] = Field(default_factory=list)
+
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+
+class _ExtractionResponse(BaseModel):
+    """The top-level shape of an extraction response."""
+
+    entities: List[_RawEntity] = Field(default_factory=list)
+
+
+class PromptSet(BaseModel):
+    """In-memory prompt templates for the entity extraction service."""
+
+    system_prompt: str = ""
+    extraction_prompt: str = ""
+    extraction_schema: Optional[Dict] = None
+
+    model_config = ConfigDict(frozen=True)
+
 
 class LLMEntityExtractionService(EntityExtractionService, LoggerMixin):
     """LLM-based implementation of the entity extraction service."""
@@ -24,27 +74,34 @@ class LLMEntityExtractionService(EntityExtractionService, LoggerMixin):
         self,
         llm_service: LLMService,
         prompts_dir: str = None,
+        prompts: Optional[PromptSet] = None,
     ):
         """Initialize the entity extraction service.
 
         Args:
             llm_service: The LLM service to use for extraction
             prompts_dir: Directory containing prompt templates (defaults to src/infrastructure/llm/prompts)
+            prompts: Prompt templates to use instead of reading prompts_dir
         """
         self._llm_service = llm_service
         self._prompts_dir = prompts_dir or os.path.join(
             os.path.dirname(__file__), "prompts"
         )
 
-        # Load prompt templates
-        self._system_prompt = self._load_prompt("entity_extraction_system.txt")
-        self._extraction_prompt = self._load_prompt("entity_extraction.txt")
+        if prompts is not None:
+            self._system_prompt = prompts.system_prompt
+            self._extraction_prompt = prompts.extraction_prompt
+            self._extraction_schema = prompts.extraction_schema
+        else:
+            # Load prompt templates
+            self._system_prompt = self._load_prompt("entity_extraction_system.txt")
+            self._extraction_prompt = self._load_prompt("entity_extraction.txt")
+
+            # Load JSON schema for structured output
+            self._extraction_schema = self._load_json_schema(
+                "entity_extraction_schema.json"
+            )
 
-        # Load JSON schema for structured output
-        self._extraction_schema = self._load_json_schema(
-            "entity_extraction_schema.json"
-        )
-        
         self.logger.info("LLM entity extraction service initialized")
 
     def _load_prompt(self, filename: str) -> str:
@@ -124,6 +181,7 @@ class LLMEntityExtractionService(EntityExtractionService, LoggerMixin):
                 system_prompt=self._system_prompt,
                 json_mode=True,
                 json_schema=self._extraction_schema,
+                parse_json=False,
             )
 
             # Convert the LLM response to SemanticEntry objects
@@ -166,28 +224,28 @@ class LLMEntityExtractionService(EntityExtractionService, LoggerMixin):
         Returns:
             The formatted prompt
         """
-        # Start with the base extraction prompt
-        prompt = self._extraction_prompt
-
-        # Replace placeholders with actual content
-        prompt = prompt.replace("{CONTENT}", content)
-
         # Add metadata if available
         if metadata:
-            metadata_str = json.dumps(metadata.dict(exclude_none=True), indent=2)
-            prompt = prompt.replace("{METADATA}", metadata_str)
+            metadata_str = metadata.model_dump_json(exclude_none=True, indent=2)
         else:
-            prompt = prompt.replace("{METADATA}", "{}")
+            metadata_str = "{}"
+
+        # Fill every placeholder in a single pass over the template
+        values = {"CONTENT": content, "METADATA": metadata_str}
+        prompt = _PROMPT_PLACEHOLDER.sub(
+            lambda match: values[match.group(1)], self._extraction_prompt
+        )
 
         return prompt
 
     def _convert_to_semantic_entries(
-        self, extraction_result: Dict, thought_id: uuid.UUID
+        self, extraction_result: Union[str, bytes, Dict], thought_id: uuid.UUID
     ) -> List[SemanticEntry]:
         """Convert the LLM extraction result to SemanticEntry objects.
 
         Args:
-            extraction_result: The parsed JSON result from the LLM
+            extraction_result: The raw JSON text from the LLM, or an
+                already parsed JSON object
             thought_id: The ID of the thought being analyzed
 
         Returns:
@@ -197,64 +255,69 @@ class LLMEntityExtractionService(EntityExtractionService, LoggerMixin):
             EntityExtractionError: If the result format is invalid
         """
         try:
-            entities = extraction_result.get("entities", [])
-            semantic_entries = []
-
-            # Create a dictionary to store entries by their temporary IDs
+            # Raw JSON is parsed and validated in one pass by pydantic-core
+            if isinstance(extraction_result, (str, bytes)):
+                response = _ExtractionResponse.model_validate_json(extraction_result)
+            else:
+                response = _ExtractionResponse.model_validate(extraction_result)
+            entities = response.entities
+            entry_dicts = []
+
+            # Map the LLM's temporary IDs to their entry dicts
             entry_map = {}
 
-            # First pass: Create all semantic entries
+            # First pass: Collect all semantic entries
             for entity in entities:
-                # Validate entity type
-                try:
-                    entity_type = EntityType(entity["type"].lower())
-                except ValueError:
-                    # Skip entities with invalid types
+                # Skip entities with invalid types
+                entity_type = EntityType.from_str(entity.type.lower())
+                if entity_type is None:
                     continue
 
-                # Create a new semantic entry
-                entry = SemanticEntry(
-                    id=uuid.uuid4(),
-                    thought_id=thought_id,
-                    entity_type=entity_type,
-                    entity_value=entity["value"],
-                    confidence=entity.get("confidence", 0.9),
-                    context=entity.get("context", ""),
-                    relationships=[],
-                    extracted_at=datetime.now(),
-                )
-
-                semantic_entries.append(entry)
+                entry = {
+                    "id": uuid.uuid4(),
+                    "thought_id": thought_id,
+                    "entity_type": entity_type,
+                    "entity_value": entity.value,
+                    "confidence": entity.confidence,
+                    "context": entity.context,
+                    "relationships": [],
+                    "extracted_at": datetime.now(),
+                }
+                entry_dicts.append(entry)
 
                 # Store the entry with its temporary ID for relationship mapping
-                entry_map[entity.get("id", str(len(entry_map)))] = entry
+                temp_id = entity.id
+                if temp_id is None:
+                    temp_id = str(len(entry_map))
+                entry_map[temp_id] = entry
 
-            # Second pass: Add relationships
+            # Second pass: Nest relationships inside their source entries
             for entity in entities:
-                if "relationships" not in entity:
+                if not entity.relationships:
                     continue
 
-                source_entry = entry_map.get(entity.get("id", ""))
+                source_entry = entry_map.get(entity.id)
                 if not source_entry:
                     continue
 
-                for rel in entity["relationships"]:
-                    target_entry = entry_map.get(rel.get("target_id", ""))
+                for rel in entity.relationships:
+                    target_entry = entry_map.get(rel.target_id)
                     if not target_entry:
                         continue
 
-                    # Create relationship
-                    relationship = Relationship(
-                        id=uuid.uuid4(),
-                        source_entity_id=source_entry.id,
-                        target_entity_id=target_entry.id,
-                        relationship_type=rel.get("type", "related_to"),
-                        strength=rel.get("strength", 0.9),
-                        created_at=datetime.now(),
+                    source_entry["relationships"].append(
+                        {
+                            "id": uuid.uuid4(),
+                            "source_entity_id": source_entry["id"],
+                            "target_entity_id": target_entry["id"],
+                            "relationship_type": rel.type,
+                            "strength": rel.strength,
+                            "created_at": datetime.now(),
+                        }
                     )
 
-                    # Add to source entry's relationships
-                    source_entry.relationships.append(relationship)
+            # Validate every entry, relationships included, in a single call
+            semantic_entries = _ENTRY_LIST_ADAPTER.validate_python(entry_dicts)
 
             return semantic_entries
 
@@ -75,6 +75,7 @@ class LLMService:
         system_prompt: Optional[str] = None,
         json_mode: bool = False,
         json_schema: Optional[Dict[str, Any]] = None,
+        parse_json: bool = True,
     ) -> Union[str, Dict[str, Any]]:
         """Generate text from the LLM.
 
@@ -83,6 +84,8 @@ class LLMService:
             system_prompt: Optional system prompt for context
             json_mode: Whether to request JSON output
             json_schema: Optional JSON schema for structured output
+            parse_json: Whether to parse JSON output; when False the raw JSON
+                text is returned so callers can validate it directly
 
         Returns:
             The generated text or parsed JSON object
@@ -135,7 +138,7 @@ class LLMService:
             content = response.choices[0].message.content
 
             # Parse JSON if requested
-            if json_mode:
+            if json_mode and parse_json:
                 try:
                     return json.loads(content)
                 except json.JSONDecodeError as e:
@@ -162,13 +162,12 @@ class HybridSearchService(SearchService):
         matches = re.findall(type_pattern, query_text, re.IGNORECASE)
 
         for match in matches:
-            try:
-                entity_type = EntityType(match.lower())
-                if entity_type not in entity_filter.entity_types:
-                    entity_filter.entity_types.append(entity_type)
-            except ValueError:
+            entity_type = EntityType.from_str(match.lower())
+            if entity_type is None:
                 # Invalid entity type, ignore
-                pass
+                continue
+            if entity_type not in entity_filter.entity_types:
+                entity_filter.entity_types.append(entity_type)
 
         return entity_filter
 
@@ -2,13 +2,18 @@
 
 import pytest
 from datetime import datetime, timedelta
-from uuid import uuid4
-from unittest.mock import AsyncMock, Mock
+from uuid import UUID
+from unittest.mock import AsyncMock
 
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
+import httpx
+import pytest_asyncio
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
 
+from src.api.models.timeline_models import TimelineRequest
 from src.api.routes.timeline import create_timeline_router
+from src.application.usecases.get_timeline_usecase import GetTimelineUseCase
 from src.domain.entities.enums import EntityType
 from src.domain.entities.timeline import (
     DateRange,
@@ -20,52 +25,114 @@ from src.domain.entities.timeline import (
 from src.domain.entities.thought import Thought, ThoughtMetadata
 from src.domain.entities.user import User
 from src.domain.exceptions import TimelineError, TimelineQueryError
+from src.infrastructure.middleware.authentication_middleware import (
+    AuthenticationMiddleware,
+)
 
+NOW = datetime(2024, 1, 15, 12, 0, 0)
+USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+THOUGHT_ID = UUID("22222222-2222-2222-2222-222222222222")
+ENTITY_ID = UUID("33333333-3333-3333-3333-333333333333")
+RELATED_ENTRY_ID = "44444444-4444-4444-4444-444444444444"
+
+ENTITY_COUNTS = {"location": 5, "emotion": 3, "person": 2}
+MOST_ACTIVE_PERIODS = (
+    {"date": "2024-01-15", "count": "3"},
+    {"date": "2024-01-14", "count": "2"},
+)
+TOP_ENTITIES = (
+    {"entity_value": "park", "entity_type": "location", "count": "3"},
+    {"entity_value": "happy", "entity_type": "emotion", "count": "2"},
+)
+
+EXPECTED_FIRST_PAGE = {
+    "total_count": 1,
+    "page": 1,
+    "page_size": 20,
+    "has_next": False,
+    "has_previous": False,
+}
+EXPECTED_MIDDLE_PAGE = {
+    "total_count": 100,
+    "page": 2,
+    "page_size": 10,
+    "has_next": True,
+    "has_previous": True,
+}
+
+
+@pytest.fixture(scope="session")
+def timeline_mocks():
+    """Create the mocked timeline dependencies, once per worker."""
+    timeline_usecase = AsyncMock(spec_set=GetTimelineUseCase)
+    auth_middleware = AsyncMock(spec_set=AuthenticationMiddleware)
+    return timeline_usecase, auth_middleware
+
+
+@pytest.fixture(autouse=True)
+def reset_timeline_mocks(timeline_mocks):
+    """Clear call history, return values and side effects before each test."""
+    timeline_usecase, auth_middleware = timeline_mocks
+    timeline_usecase.reset_mock(return_value=True, side_effect=True)
+    auth_middleware.reset_mock(return_value=True, side_effect=True)
+
+
+def _route_endpoint(app, path):
+    """Return the endpoint function registered for a path."""
+    return next(route.endpoint for route in app.routes if route.path == path)
 
-@pytest.fixture
-def mock_container():
-    """Create a mock container with timeline dependencies."""
-    container = Mock()
-    
-    # Mock timeline use case
-    timeline_usecase = AsyncMock()
-    container.get_timeline_usecase.return_value = timeline_usecase
-    
-    # Mock auth middleware
-    auth_middleware = AsyncMock()
-    container.auth_middleware.return_value = auth_middleware
-    
-    return container, timeline_usecase, auth_middleware
+
+@pytest.fixture(scope="session")
+def timeline_app(timeline_mocks):
+    """Create the timeline test app once with the shared mocks."""
+    timeline_usecase, auth_middleware = timeline_mocks
+    app = FastAPI(default_response_class=ORJSONResponse)
+    timeline_router = create_timeline_router(
+        get_timeline_usecase=timeline_usecase,
+        auth_middleware=auth_middleware,
+    )
+    app.include_router(timeline_router)
+    return app
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(timeline_app):
+    """Create an async HTTP client shared by all timeline tests in a worker."""
+    transport = httpx.ASGITransport(app=timeline_app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as async_client:
+        yield async_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_user():
     """Create a test user."""
     return User(
-        id=uuid4(),
+        id=USER_ID,
         email="test@example.com",
         hashed_password="hashed_password",
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=NOW,
+        updated_at=NOW,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_timeline_entry():
     """Create a sample timeline entry for testing."""
     thought = Thought(
-        id=uuid4(),
-        user_id=uuid4(),
+        id=THOUGHT_ID,
+        user_id=USER_ID,
         content="I went to the park today and felt happy",
-        timestamp=datetime.now(),
+        timestamp=NOW,
         metadata=ThoughtMetadata(),
         semantic_entries=[],
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=NOW,
+        updated_at=NOW,
     )
     
     connection = EntityConnection(
-        entity_id=uuid4(),
+        entity_id=ENTITY_ID,
         entity_type=EntityType.LOCATION,
         entity_value="park",
         confidence=0.9,
@@ -82,7 +149,7 @@ def sample_timeline_entry():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_timeline_response(sample_timeline_entry):
     """Create a sample timeline response."""
     return TimelineResponse(
@@ -96,54 +163,37 @@ def sample_timeline_response(sample_timeline_entry):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_timeline_summary():
     """Create a sample timeline summary."""
     return TimelineSummary(
         total_entries=10,
         date_range=DateRange(
-            start_date=datetime.now() - timedelta(days=30),
-            end_date=datetime.now(),
+            start_date=NOW - timedelta(days=30),
+            end_date=NOW,
         ),
-        entity_counts={"location": 5, "emotion": 3, "person": 2},
-        most_active_periods=[
-            {"date": "2024-01-15", "count": "3"},
-            {"date": "2024-01-14", "count": "2"},
-        ],
-        top_entities=[
-            {"entity_value": "park", "entity_type": "location", "count": "3"},
-            {"entity_value": "happy", "entity_type": "emotion", "count": "2"},
-        ],
+        entity_counts=dict(ENTITY_COUNTS),
+        most_active_periods=list(MOST_ACTIVE_PERIODS),
+        top_entities=list(TOP_ENTITIES),
     )
 
 
+@pytest.mark.integration
+# The shared HTTP client lives on the session loop, so the tests must too.
+@pytest.mark.asyncio(loop_scope="session")
 class TestTimelineEndpoints:
     """Test cases for timeline API endpoints."""
 
-    def _create_test_app(self, timeline_usecase, auth_middleware):
-        """Create a test FastAPI app with mocked dependencies."""
-        app = FastAPI()
-        timeline_router = create_timeline_router(
-            get_timeline_usecase=timeline_usecase,
-            auth_middleware=auth_middleware,
-        )
-        app.include_router(timeline_router)
-        return app
-
-    def test_get_timeline_success(self, mock_container, test_user, sample_timeline_response):
+    async def test_get_timeline_success(self, client, timeline_mocks, test_user, sample_timeline_response):
         """Test successful timeline retrieval."""
-        container, timeline_usecase, auth_middleware = mock_container
+        timeline_usecase, auth_middleware = timeline_mocks
         
         # Setup mocks
         auth_middleware.require_authentication.return_value = test_user
         timeline_usecase.execute.return_value = sample_timeline_response
         
-        # Create app with mocked dependencies
-        app = self._create_test_app(timeline_usecase, auth_middleware)
-        client = TestClient(app)
-        
         # Make request
-        response = client.get(
+        response = await client.get(
             "/api/v1/timeline",
             headers={"Authorization": "Bearer test_token"},
         )
@@ -152,27 +202,19 @@ class TestTimelineEndpoints:
         assert response.status_code == 200
         data = response.json()
         
-        assert data["total_count"] == 1
-        assert data["page"] == 1
-        assert data["page_size"] == 20
+        assert {key: data[key] for key in EXPECTED_FIRST_PAGE} == EXPECTED_FIRST_PAGE
         assert len(data["entries"]) == 1
-        assert data["has_next"] is False
-        assert data["has_previous"] is False
 
-    def test_get_timeline_with_filters(self, mock_container, test_user, sample_timeline_response):
+    async def test_get_timeline_with_filters(self, client, timeline_mocks, test_user, sample_timeline_response):
         """Test timeline retrieval with filters."""
-        container, timeline_usecase, auth_middleware = mock_container
+        timeline_usecase, auth_middleware = timeline_mocks
         
         # Setup mocks
         auth_middleware.require_authentication.return_value = test_user
         timeline_usecase.execute.return_value = sample_timeline_response
         
-        # Create app with mocked dependencies
-        app = self._create_test_app(timeline_usecase, auth_middleware)
-        client = TestClient(app)
-        
         # Make request with filters
-        response = client.get(
+        response = await client.get(
             "/api/v1/timeline?"
             "start_date=2024-01-01T00:00:00Z&"
             "end_date=2024-12-31T23:59:59Z&"
@@ -198,105 +240,128 @@ class TestTimelineEndpoints:
         assert call_args[1]["page_size"] == 10
         assert call_args[1]["sort_order"] == "desc"
 
-    def test_get_timeline_invalid_date_format(self, mock_container, test_user):
+    async def test_get_timeline_invalid_date_format(self, timeline_app, test_user):
         """Test timeline with invalid date format."""
-        container, timeline_usecase, auth_middleware = mock_container
-        
-        # Setup mocks
-        auth_middleware.require_authentication.return_value = test_user
-        
-        # Create app with mocked dependencies
-        app = self._create_test_app(timeline_usecase, auth_middleware)
-        client = TestClient(app)
-        
-        # Make request with invalid date
-        response = client.get(
-            "/api/v1/timeline?start_date=invalid-date",
-            headers={"Authorization": "Bearer test_token"},
-        )
-        
-        # Assertions
-        assert response.status_code == 400
-        data = response.json()
-        assert "Invalid start_date format" in data["detail"]
+        get_timeline = _route_endpoint(timeline_app, "/api/v1/timeline")
+
+        # Call the route directly with an invalid date
+        with pytest.raises(HTTPException) as exc_info:
+            await get_timeline(
+                start_date="invalid-date",
+                end_date=None,
+                entity_types=[],
+                data_sources=[],
+                tags=[],
+                page=1,
+                page_size=20,
+                sort_order="desc",
+                include_groups=False,
+                include_summary=False,
+                current_user=test_user,
+            )
 
-    def test_get_timeline_query_error(self, mock_container, test_user):
-        """Test timeline with query parsing error."""
-        container, timeline_usecase, auth_middleware = mock_container
-        
-        # Setup mocks
-        auth_middleware.require_authentication.return_value = test_user
-        timeline_usecase.execute.side_effect = TimelineQueryError("Invalid query parameters")
-        
-        # Create app with mocked dependencies
-        app = self._create_test_app(timeline_usecase, auth_middleware)
-        client = TestClient(app)
-        
-        # Make request
-        response = client.get(
-            "/api/v1/timeline",
-            headers={"Authorization": "Bearer test_token"},
-        )
-        
         # Assertions
-        assert response.status_code == 422
-        data = response.json()
-        assert "Timeline query parsing failed" in data["detail"]
+        assert exc_info.value.status_code == 400
+        assert "Invalid start_date format" in exc_info.value.detail
+
+    @pytest.mark.parametrize(
+        "url, method, error, expected_status, expected_detail",
+        [
+            (
+                "/api/v1/timeline",
+                "execute",
+                TimelineQueryError("Invalid query parameters"),
+                422,
+                "Timeline query parsing failed",
+            ),
+            (
+                "/api/v1/timeline",
+                "execute",
+                TimelineError("Timeline service unavailable"),
+                400,
+                "Timeline retrieval failed",
+            ),
+            (
+                "/api/v1/timeline/summary",
+                "get_summary",
+                TimelineError("Summary generation failed"),
+                400,
+                "Timeline summary generation failed",
+            ),
+            (
+                f"/api/v1/timeline/entries/{RELATED_ENTRY_ID}/related",
+                "get_related_entries",
+                TimelineQueryError("Invalid limit"),
+                400,
+                "Invalid limit",
+            ),
+            (
+                f"/api/v1/timeline/entries/{RELATED_ENTRY_ID}/related",
+                "get_related_entries",
+                TimelineError("Related entries search failed"),
+                400,
+                "Related entries retrieval failed",
+            ),
+        ],
+        ids=[
+            "timeline_query_error",
+            "timeline_error",
+            "summary_error",
+            "related_entries_query_error",
+            "related_entries_error",
+        ],
+    )
+    async def test_timeline_error_responses(
+        self,
+        client,
+        timeline_mocks,
+        test_user,
+        url,
+        method,
+        error,
+        expected_status,
+        expected_detail,
+    ):
+        """Test that timeline errors map to the expected HTTP responses."""
+        timeline_usecase, auth_middleware = timeline_mocks
 
-    def test_get_timeline_error(self, mock_container, test_user):
-        """Test timeline with general error."""
-        container, timeline_usecase, auth_middleware = mock_container
-        
         # Setup mocks
         auth_middleware.require_authentication.return_value = test_user
-        timeline_usecase.execute.side_effect = TimelineError("Timeline service unavailable")
-        
-        # Create app with mocked dependencies
-        app = self._create_test_app(timeline_usecase, auth_middleware)
-        client = TestClient(app)
-        
+        getattr(timeline_usecase, method).side_effect = error
+
         # Make request
-        response = client.get(
-            "/api/v1/timeline",
-            headers={"Authorization": "Bearer test_token"},
+        response = await client.get(
+            url, headers={"Authorization": "Bearer test_token"}
         )
-        
+
         # Assertions
-        assert response.status_code == 400
+        assert response.status_code == expected_status
         data = response.json()
-        assert "Timeline retrieval failed" in data["detail"]
+        assert expected_detail in data["detail"]
 
-    def test_get_timeline_unauthorized(self, mock_container):
+    async def test_get_timeline_unauthorized(self, client, timeline_mocks):
         """Test timeline without authentication."""
-        container, timeline_usecase, auth_middleware = mock_container
+        timeline_usecase, auth_middleware = timeline_mocks
         
         # Setup mocks
         auth_middleware.require_authentication.side_effect = Exception("Unauthorized")
         
-        # Create app with mocked dependencies
-        app = self._create_test_app(timeline_usecase, auth_middleware)
-        client = TestClient(app)
-        
         # Make request without auth header
-        response = client.get("/api/v1/timeline")
+        response = await client.get("/api/v1/timeline")
         
         # Assertions
         assert response.status_code == 500  # Exception handling
 
-    def test_get_timeline_summary_success(self, mock_container, test_user, sample_timeline_summary):
+    async def test_get_timeline_summary_success(self, client, timeline_mocks, test_user, sample_timeline_summary):
         """Test successful timeline summary retrieval."""
-        container, timeline_usecase, auth_middleware = mock_container
+        timeline_usecase, auth_middleware = timeline_mocks
         
         # Setup mocks
         auth_middleware.require_authentication.return_value = test_user
         timeline_usecase.get_summary.return_value = sample_timeline_summary
         
-        # Create app with mocked dependencies
-        app = self._create_test_app(timeline_usecase, auth_middleware)
-        client = TestClient(app)
-        
         # Make request
-        response = client.get(
+        response = await client.get(
             "/api/v1/timeline/summary",
             headers={"Authorization": "Bearer test_token"},
         )
@@ -312,44 +377,17 @@ class TestTimelineEndpoints:
         assert len(data["most_active_periods"]) == 2
         assert len(data["top_entities"]) == 2
 
-    def test_get_timeline_summary_error(self, mock_container, test_user):
-        """Test timeline summary with error."""
-        container, timeline_usecase, auth_middleware = mock_container
-        
-        # Setup mocks
-        auth_middleware.require_authentication.return_value = test_user
-        timeline_usecase.get_summary.side_effect = TimelineError("Summary generation failed")
-        
-        # Create app with mocked dependencies
-        app = self._create_test_app(timeline_usecase, auth_middleware)
-        client = TestClient(app)
-        
-        # Make request
-        response = client.get(
-            "/api/v1/timeline/summary",
-            headers={"Authorization": "Bearer test_token"},
-        )
-        
-        # Assertions
-        assert response.status_code == 400
-        data = response.json()
-        assert "Timeline summary generation failed" in data["detail"]
-
-    def test_get_related_entries_success(self, mock_container, test_user, sample_timeline_entry):
+    async def test_get_related_entries_success(self, client, timeline_mocks, test_user, sample_timeline_entry):
         """Test successful related entries retrieval."""
-        container, timeline_usecase, auth_middleware = mock_container
+        timeline_usecase, auth_middleware = timeline_mocks
         
         # Setup mocks
         auth_middleware.require_authentication.return_value = test_user
         timeline_usecase.get_related_entries.return_value = [sample_timeline_entry]
         
-        # Create app with mocked dependencies
-        app = self._create_test_app(timeline_usecase, auth_middleware)
-        client = TestClient(app)
-        
         # Make request
-        entry_id = str(uuid4())
-        response = client.get(
+        entry_id = RELATED_ENTRY_ID
+        response = await client.get(
             f"/api/v1/timeline/entries/{entry_id}/related?limit=5",
             headers={"Authorization": "Bearer test_token"},
         )
@@ -362,79 +400,30 @@ class TestTimelineEndpoints:
         assert len(data["related_entries"]) == 1
         assert data["total_count"] == 1
 
-    def test_get_related_entries_query_error(self, mock_container, test_user):
-        """Test related entries with query error."""
-        container, timeline_usecase, auth_middleware = mock_container
-        
-        # Setup mocks
-        auth_middleware.require_authentication.return_value = test_user
-        timeline_usecase.get_related_entries.side_effect = TimelineQueryError("Invalid limit")
-        
-        # Create app with mocked dependencies
-        app = self._create_test_app(timeline_usecase, auth_middleware)
-        client = TestClient(app)
-        
-        # Make request
-        entry_id = str(uuid4())
-        response = client.get(
-            f"/api/v1/timeline/entries/{entry_id}/related",
-            headers={"Authorization": "Bearer test_token"},
-        )
-        
-        # Assertions
-        assert response.status_code == 400
-        data = response.json()
-        assert "Invalid limit" in data["detail"]
-
-    def test_get_related_entries_error(self, mock_container, test_user):
-        """Test related entries with general error."""
-        container, timeline_usecase, auth_middleware = mock_container
-        
-        # Setup mocks
-        auth_middleware.require_authentication.return_value = test_user
-        timeline_usecase.get_related_entries.side_effect = TimelineError("Related entries search failed")
-        
-        # Create app with mocked dependencies
-        app = self._create_test_app(timeline_usecase, auth_middleware)
-        client = TestClient(app)
-        
-        # Make request
-        entry_id = str(uuid4())
-        response = client.get(
-            f"/api/v1/timeline/entries/{entry_id}/related",
-            headers={"Authorization": "Bearer test_token"},
-        )
-        
-        # Assertions
-        assert response.status_code == 400
-        data = response.json()
-        assert "Related entries retrieval failed" in data["detail"]
-
-    def test_timeline_pagination(self, mock_container, test_user):
+    async def test_timeline_pagination(
+        self, client, timeline_mocks, test_user, sample_timeline_response
+    ):
         """Test timeline pagination parameters."""
-        container, timeline_usecase, auth_middleware = mock_container
+        timeline_usecase, auth_middleware = timeline_mocks
         
         # Setup mocks
         auth_middleware.require_authentication.return_value = test_user
         
-        # Create timeline response with pagination
-        timeline_response = TimelineResponse(
-            entries=[],
-            groups=[],
-            total_count=100,
-            page=2,
-            page_size=10,
-            has_next=True,
-            has_previous=True,
+        # Derive a paginated response from the shared sample
+        timeline_response = sample_timeline_response.model_copy(
+            update={
+                "entries": [],
+                "total_count": 100,
+                "page": 2,
+                "page_size": 10,
+                "has_next": True,
+                "has_previous": True,
+            }
         )
         timeline_usecase.execute.return_value = timeline_response
         
-        # Create app with mocked dependencies
-        app = self._create_test_app(timeline_usecase, auth_middleware)
-        client = TestClient(app)
-        
         # Make request with pagination
-        response = client.get(
+        response = await client.get(
             "/api/v1/timeline?page=2&page_size=10",
             headers={"Authorization": "Bearer test_token"},
         )
@@ -443,28 +432,11 @@ class TestTimelineEndpoints:
         assert response.status_code == 200
         data = response.json()
         
-        assert data["page"] == 2
-        assert data["page_size"] == 10
-        assert data["total_count"] == 100
-        assert data["has_next"] is True
-        assert data["has_previous"] is True
-
-    def test_timeline_sort_order_validation(self, mock_container, test_user):
-        """Test timeline sort order validation."""
-        container, timeline_usecase, auth_middleware = mock_container
-        
-        # Setup mocks
-        auth_middleware.require_authentication.return_value = test_user
-        
-        # Create app with mocked dependencies
-        app = self._create_test_app(timeline_usecase, auth_middleware)
-        client = TestClient(app)
-        
-        # Make request with invalid sort order
-        response = client.get(
-            "/api/v1/timeline?sort_order=invalid",
-            headers={"Authorization": "Bearer test_token"},
-        )
-        
-        # Assertions
-        assert response.status_code == 422  # Validation error
\ No newline at end of file
+        assert {key: data[key] for key in EXPECTED_MIDDLE_PAGE} == EXPECTED_MIDDLE_PAGE
+
+
+
+def test_timeline_sort_order_validation():
+    """Test timeline sort order validation."""
+    with pytest.raises(ValidationError):
+        TimelineRequest(sort_order="invalid")
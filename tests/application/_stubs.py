@@ -0,0 +1,124 @@
+"""Lightweight async test doubles for the application layer tests."""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from unittest.mock import call
+
+
+class _Stub:
+    """Record calls as ``unittest.mock.call`` entries and replay configured results.
+
+    Stub methods take ``*args, **kwargs`` and record them exactly as passed,
+    so assertions see the caller's arguments rather than filled-in defaults.
+    """
+
+    calls: list
+
+    def _respond(self, method, *args, **kwargs):
+        self.calls.append(getattr(call, method)(*args, **kwargs))
+        raises = getattr(self, f"{method}_raises")
+        if raises is not None:
+            raise raises
+        return getattr(self, f"{method}_return")
+
+
+@dataclass
+class StubUserManagementService(_Stub):
+    """Stand-in for UserManagementService in login and registration tests."""
+
+    authenticate_user_return: Any = None
+    authenticate_user_raises: Optional[Exception] = None
+    update_last_login_return: Any = None
+    update_last_login_raises: Optional[Exception] = None
+    register_user_return: Any = None
+    register_user_raises: Optional[Exception] = None
+    calls: list = field(default_factory=list)
+
+    async def authenticate_user(self, *args, **kwargs):
+        return self._respond("authenticate_user", *args, **kwargs)
+
+    async def update_last_login(self, *args, **kwargs):
+        return self._respond("update_last_login", *args, **kwargs)
+
+    async def register_user(self, *args, **kwargs):
+        return self._respond("register_user", *args, **kwargs)
+
+
+@dataclass
+class StubAuthenticationService(_Stub):
+    """Stand-in for AuthenticationService in login and admin tests."""
+
+    create_access_token_return: Any = None
+    create_access_token_raises: Optional[Exception] = None
+    hash_password_return: Any = None
+    hash_password_raises: Optional[Exception] = None
+    calls: list = field(default_factory=list)
+
+    async def create_access_token(self, *args, **kwargs):
+        return self._respond("create_access_token", *args, **kwargs)
+
+    async def hash_password(self, *args, **kwargs):
+        return self._respond("hash_password", *args, **kwargs)
+
+
+@dataclass
+class StubUserRepository(_Stub):
+    """Stand-in for UserRepository in admin tests."""
+
+    find_all_return: Any = field(default_factory=list)
+    find_all_raises: Optional[Exception] = None
+    find_by_email_return: Any = None
+    find_by_email_raises: Optional[Exception] = None
+    save_return: Any = None
+    save_raises: Optional[Exception] = None
+    calls: list = field(default_factory=list)
+
+    async def find_all(self, *args, **kwargs):
+        return self._respond("find_all", *args, **kwargs)
+
+    async def find_by_email(self, *args, **kwargs):
+        return self._respond("find_by_email", *args, **kwargs)
+
+    async def save(self, *args, **kwargs):
+        return self._respond("save", *args, **kwargs)
+
+
+@dataclass
+class StubThoughtRepository(_Stub):
+    """Stand-in for ThoughtRepository in admin tests."""
+
+    find_by_user_return: Any = field(default_factory=list)
+    find_by_user_raises: Optional[Exception] = None
+    calls: list = field(default_factory=list)
+
+    async def find_by_user(self, *args, **kwargs):
+        return self._respond("find_by_user", *args, **kwargs)
+
+
+@dataclass
+class StubSearchRepository(_Stub):
+    """Stand-in for SearchRepository in search tests."""
+
+    search_return: Any = None
+    search_raises: Optional[Exception] = None
+    get_suggestions_return: Any = None
+    get_suggestions_raises: Optional[Exception] = None
+    calls: list = field(default_factory=list)
+
+    async def search(self, *args, **kwargs):
+        return self._respond("search", *args, **kwargs)
+
+    async def get_suggestions(self, *args, **kwargs):
+        return self._respond("get_suggestions", *args, **kwargs)
+
+
+@dataclass
+class StubSearchService(_Stub):
+    """Stand-in for SearchService in search tests."""
+
+    parse_query_return: Any = None
+    parse_query_raises: Optional[Exception] = None
+    calls: list = field(default_factory=list)
+
+    async def parse_query(self, *args, **kwargs):
+        return self._respond("parse_query", *args, **kwargs)
@@ -1,15 +1,48 @@
 """Unit tests for admin use cases."""
 
 import pytest
-from unittest.mock import AsyncMock, Mock
-from uuid import uuid4
+from unittest.mock import AsyncMock, Mock, call
+from uuid import UUID
 from datetime import datetime
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from src.application.usecases.get_users_usecase import GetUsersUseCase
 from src.application.usecases.create_user_usecase import CreateUserUseCase
 from src.application.usecases.get_system_health_usecase import GetSystemHealthUseCase
 from src.domain.entities.user import User
 from src.domain.exceptions import UserAlreadyExistsError
+from src.infrastructure.database.connection import Database
+from tests.application._stubs import (
+    StubAuthenticationService,
+    StubThoughtRepository,
+    StubUserRepository,
+)
+
+pytestmark = pytest.mark.unit
+
+NOW = datetime(2024, 1, 15, 12, 0, 0)
+USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+OTHER_USER_ID = UUID("22222222-2222-2222-2222-222222222222")
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+
+@pytest.fixture(autouse=True, scope="module")
+def frozen_now():
+    """Freeze datetime.now() inside the use cases under test."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for module in ("create_user_usecase", "get_system_health_usecase"):
+            monkeypatch.setattr(
+                f"src.application.usecases.{module}.datetime", _FrozenDatetime
+            )
+        yield
 
 
 class TestGetUsersUseCase:
@@ -17,8 +50,8 @@ class TestGetUsersUseCase:
 
     @pytest.fixture
     def mock_user_repository(self):
-        """Create a mock user repository."""
-        return AsyncMock()
+        """Create a stub user repository."""
+        return StubUserRepository()
 
     @pytest.fixture
     def use_case(self, mock_user_repository):
@@ -30,54 +63,50 @@ class TestGetUsersUseCase:
         # Arrange
         expected_users = [
             User(
-                id=uuid4(),
+                id=USER_ID,
                 email="user1@example.com",
                 hashed_password="hash1",
                 is_admin=False,
                 is_active=True,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
+                created_at=NOW,
+                updated_at=NOW,
             ),
             User(
-                id=uuid4(),
+                id=OTHER_USER_ID,
                 email="user2@example.com",
                 hashed_password="hash2",
                 is_admin=True,
                 is_active=True,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
+                created_at=NOW,
+                updated_at=NOW,
             ),
         ]
-        mock_user_repository.find_all.return_value = expected_users
+        mock_user_repository.find_all_return = expected_users
 
         # Act
         result = await use_case.execute(skip=0, limit=10)
 
         # Assert
         assert result == expected_users
-        mock_user_repository.find_all.assert_called_once_with(skip=0, limit=10)
-
-    async def test_execute_with_custom_pagination(self, use_case, mock_user_repository):
-        """Test execute with custom pagination parameters."""
-        # Arrange
-        mock_user_repository.find_all.return_value = []
-
-        # Act
-        await use_case.execute(skip=20, limit=50)
-
-        # Assert
-        mock_user_repository.find_all.assert_called_once_with(skip=20, limit=50)
-
-    async def test_execute_with_default_pagination(self, use_case, mock_user_repository):
-        """Test execute with default pagination parameters."""
-        # Arrange
-        mock_user_repository.find_all.return_value = []
-
+        assert mock_user_repository.calls == [call.find_all(skip=0, limit=10)]
+
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({"skip": 20, "limit": 50}, {"skip": 20, "limit": 50}),
+            ({}, {"skip": 0, "limit": 100}),
+        ],
+        ids=["custom_pagination", "default_pagination"],
+    )
+    async def test_execute_pagination(
+        self, use_case, mock_user_repository, kwargs, expected
+    ):
+        """Test execute forwards custom and default pagination parameters."""
         # Act
-        await use_case.execute()
+        await use_case.execute(**kwargs)
 
         # Assert
-        mock_user_repository.find_all.assert_called_once_with(skip=0, limit=100)
+        assert mock_user_repository.calls == [call.find_all(**expected)]
 
 
 class TestCreateUserUseCase:
@@ -85,91 +114,73 @@ class TestCreateUserUseCase:
 
     @pytest.fixture
     def mock_user_repository(self):
-        """Create a mock user repository."""
-        return AsyncMock()
+        """Create a stub user repository."""
+        return StubUserRepository()
 
     @pytest.fixture
     def mock_authentication_service(self):
-        """Create a mock authentication service."""
-        return AsyncMock()
+        """Create a stub authentication service."""
+        return StubAuthenticationService()
 
     @pytest.fixture
     def use_case(self, mock_user_repository, mock_authentication_service):
         """Create the use case with mocked dependencies."""
         return CreateUserUseCase(mock_user_repository, mock_authentication_service)
 
+    @pytest.mark.parametrize(
+        "is_admin, is_active",
+        [(False, True), (True, True), (False, False)],
+        ids=["regular_user", "admin_user", "inactive_user"],
+    )
     async def test_execute_creates_user_successfully(
-        self, use_case, mock_user_repository, mock_authentication_service
+        self,
+        use_case,
+        mock_user_repository,
+        mock_authentication_service,
+        is_admin,
+        is_active,
     ):
-        """Test successful user creation."""
+        """Test successful creation of regular, admin and inactive users."""
         # Arrange
         email = "newuser@example.com"
         password = "secure_password123"
         hashed_password = "hashed_secure_password123"
 
-        mock_user_repository.find_by_email.return_value = None  # User doesn't exist
-        mock_authentication_service.hash_password.return_value = hashed_password
+        mock_user_repository.find_by_email_return = None  # User doesn't exist
+        mock_authentication_service.hash_password_return = hashed_password
 
         created_user = User(
-            id=uuid4(),
+            id=USER_ID,
             email=email,
             hashed_password=hashed_password,
-            is_admin=False,
-            is_active=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            is_admin=is_admin,
+            is_active=is_active,
+            created_at=NOW,
+            updated_at=NOW,
         )
-        mock_user_repository.save.return_value = created_user
+        mock_user_repository.save_return = created_user
 
         # Act
         result = await use_case.execute(
-            email=email, password=password, is_admin=False, is_active=True
+            email=email, password=password, is_admin=is_admin, is_active=is_active
         )
 
         # Assert
         assert result == created_user
-        mock_user_repository.find_by_email.assert_called_once_with(email)
-        mock_authentication_service.hash_password.assert_called_once_with(password)
-        mock_user_repository.save.assert_called_once()
+        saved_user = mock_user_repository.calls[-1].args[0]
+        assert mock_user_repository.calls == [
+            call.find_by_email(email),
+            call.save(saved_user),
+        ]
+        assert mock_authentication_service.calls == [call.hash_password(password)]
 
         # Verify the user object passed to save has correct properties
-        saved_user = mock_user_repository.save.call_args[0][0]
         assert saved_user.email == email
         assert saved_user.hashed_password == hashed_password
-        assert saved_user.is_admin is False
-        assert saved_user.is_active is True
-
-    async def test_execute_creates_admin_user(
-        self, use_case, mock_user_repository, mock_authentication_service
-    ):
-        """Test creating an admin user."""
-        # Arrange
-        email = "admin@example.com"
-        password = "admin_password123"
-        hashed_password = "hashed_admin_password123"
-
-        mock_user_repository.find_by_email.return_value = None
-        mock_authentication_service.hash_password.return_value = hashed_password
-
-        created_user = User(
-            id=uuid4(),
-            email=email,
-            hashed_password=hashed_password,
-            is_admin=True,
-            is_active=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        mock_user_repository.save.return_value = created_user
-
-        # Act
-        result = await use_case.execute(
-            email=email, password=password, is_admin=True, is_active=True
-        )
-
-        # Assert
-        saved_user = mock_user_repository.save.call_args[0][0]
-        assert saved_user.is_admin is True
+        assert saved_user.is_admin is is_admin
+        assert saved_user.is_active is is_active
+        assert saved_user.created_at == NOW
+        assert saved_user.updated_at == NOW
 
     async def test_execute_raises_error_when_user_exists(
         self, use_case, mock_user_repository, mock_authentication_service
@@ -178,15 +189,15 @@ class TestCreateUserUseCase:
         # Arrange
         email = "existing@example.com"
         existing_user = User(
-            id=uuid4(),
+            id=USER_ID,
             email=email,
             hashed_password="existing_hash",
             is_admin=False,
             is_active=True,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=NOW,
+            updated_at=NOW,
         )
-        mock_user_repository.find_by_email.return_value = existing_user
+        mock_user_repository.find_by_email_return = existing_user
 
         # Act & Assert
         with pytest.raises(UserAlreadyExistsError) as exc_info:
@@ -195,65 +206,40 @@ class TestCreateUserUseCase:
             )
 
         assert str(exc_info.value) == f"User with email {email} already exists"
-        mock_user_repository.find_by_email.assert_called_once_with(email)
-        mock_authentication_service.hash_password.assert_not_called()
-        mock_user_repository.save.assert_not_called()
-
-    async def test_execute_creates_inactive_user(
-        self, use_case, mock_user_repository, mock_authentication_service
-    ):
-        """Test creating an inactive user."""
-        # Arrange
-        email = "inactive@example.com"
-        password = "password123"
-        hashed_password = "hashed_password123"
-
-        mock_user_repository.find_by_email.return_value = None
-        mock_authentication_service.hash_password.return_value = hashed_password
-
-        created_user = User(
-            id=uuid4(),
-            email=email,
-            hashed_password=hashed_password,
-            is_admin=False,
-            is_active=False,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        mock_user_repository.save.return_value = created_user
-
-        # Act
-        result = await use_case.execute(
-            email=email, password=password, is_admin=False, is_active=False
-        )
-
-        # Assert
-        saved_user = mock_user_repository.save.call_args[0][0]
-        assert saved_user.is_active is False
+        assert mock_user_repository.calls == [call.find_by_email(email)]
+        assert mock_authentication_service.calls == []
 
 
 class TestGetSystemHealthUseCase:
     """Test the GetSystemHealthUseCase."""
 
-    @pytest.fixture
-    def mock_database(self):
-        """Create a mock database."""
-        mock_db = Mock()
-        mock_session = AsyncMock()
+    @pytest.fixture(scope="class")
+    def database_mocks(self):
+        """Create the database, session and session context mocks once."""
+        mock_db = Mock(spec_set=Database)
+        mock_session = AsyncMock(spec_set=AsyncSession)
         mock_context_manager = AsyncMock()
+        return mock_db, mock_session, mock_context_manager
+
+    @pytest.fixture
+    def mock_database(self, database_mocks):
+        """Reset the shared database mocks and wire up the session context."""
+        mock_db, mock_session, mock_context_manager = database_mocks
+        for mock in database_mocks:
+            mock.reset_mock(return_value=True, side_effect=True)
         mock_context_manager.__aenter__.return_value = mock_session
         mock_db.session.return_value = mock_context_manager
         return mock_db
 
     @pytest.fixture
     def mock_user_repository(self):
-        """Create a mock user repository."""
-        return AsyncMock()
+        """Create a stub user repository."""
+        return StubUserRepository()
 
     @pytest.fixture
     def mock_thought_repository(self):
-        """Create a mock thought repository."""
-        return AsyncMock()
+        """Create a stub thought repository."""
+        return StubThoughtRepository()
 
     @pytest.fixture
     def use_case(self, mock_database, mock_user_repository, mock_thought_repository):
@@ -266,16 +252,12 @@ class TestGetSystemHealthUseCase:
         self, use_case, mock_database, mock_user_repository, mock_thought_repository
     ):
         """Test that execute returns healthy status when all services are working."""
-        # Arrange
-        mock_user_repository.find_all.return_value = []
-        mock_thought_repository.find_by_user.return_value = []
-
         # Act
         result = await use_case.execute()
 
         # Assert
         assert result["status"] == "healthy"
-        assert "timestamp" in result
+        assert result["timestamp"] == NOW.isoformat()
         assert "services" in result
         assert "statistics" in result
         assert result["services"]["database"]["status"] == "healthy"
@@ -290,8 +272,6 @@ class TestGetSystemHealthUseCase:
         mock_database.session.return_value.__aenter__.side_effect = Exception(
             "Database connection failed"
         )
-        mock_user_repository.find_all.return_value = []
-        mock_thought_repository.find_by_user.return_value = []
 
         # Act
         result = await use_case.execute()
@@ -306,8 +286,7 @@ class TestGetSystemHealthUseCase:
     ):
         """Test that execute returns degraded status when repositories fail."""
         # Arrange
-        mock_user_repository.find_all.side_effect = Exception("Repository error")
-        mock_thought_repository.find_by_user.return_value = []
+        mock_user_repository.find_all_raises = Exception("Repository error")
 
         # Act
         result = await use_case.execute()
@@ -321,19 +300,15 @@ class TestGetSystemHealthUseCase:
         self, use_case, mock_database, mock_user_repository, mock_thought_repository
     ):
         """Test that repositories are called with correct parameters."""
-        # Arrange
-        mock_user_repository.find_all.return_value = []
-        mock_thought_repository.find_by_user.return_value = []
-
         # Act
         await use_case.execute()
 
         # Assert
-        mock_user_repository.find_all.assert_called_once_with(limit=1)
-        mock_thought_repository.find_by_user.assert_called_once()
-        
+        assert mock_user_repository.calls == [call.find_all(limit=1)]
+        assert len(mock_thought_repository.calls) == 1
+
         # Verify that find_by_user was called with a UUID
-        call_args = mock_thought_repository.find_by_user.call_args
-        assert call_args[1]["skip"] == 0
-        assert call_args[1]["limit"] == 1
+        _, _, call_kwargs = mock_thought_repository.calls[0]
+        assert call_kwargs["skip"] == 0
+        assert call_kwargs["limit"] == 1
         # The user_id should be a UUID (we can't predict the exact value)
\ No newline at end of file
@@ -1,17 +1,136 @@
-"""Conftest for use case tests."""
+"""Shared fixtures and configuration for the application use case tests."""
 
-import pytest
-import pytest_asyncio
-import asyncio
-import sys
+import inspect
 from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+from uuid import UUID
+
+import pytest
+
+from src.domain.entities.search_query import Pagination, SearchQuery
+from src.domain.entities.search_result import SearchResponse, SearchResult, SearchScore
+from src.domain.entities.thought import Thought, ThoughtMetadata
+from src.domain.entities.user import User
+from src.domain.repositories.semantic_entry_repository import SemanticEntryRepository
+from src.domain.repositories.thought_repository import ThoughtRepository
+from src.domain.services.entity_extraction_service import EntityExtractionService
+
+_USECASE_TESTS = Path(__file__).parent
+
+SAMPLE_USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+SAMPLE_THOUGHT_ID = UUID("22222222-2222-2222-2222-222222222222")
+
+_MOCKED_METHODS = {
+    ThoughtRepository: ("save", "update", "find_by_id", "find_by_user", "delete"),
+    SemanticEntryRepository: ("save_many", "delete_by_thought"),
+    EntityExtractionService: ("extract_entities",),
+}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark every use case test as a unit test.
+
+    These tests only talk to in-process mocks and keep no state outside
+    their fixtures, so pytest-xdist is free to schedule them on any worker
+    (``pytest -n auto tests/application/usecases``).
+    """
+    for item in items:
+        if _USECASE_TESTS in item.path.parents:
+            item.add_marker(pytest.mark.unit)
+
+
+@pytest.fixture(scope="session")
+def collaborator_mocks():
+    """Collaborator mocks, built once per session (per xdist worker).
+
+    The mocks are not spec'd, so check once that every mocked method is
+    still an async method of the interface it stands in for.
+    """
+    for interface, names in _MOCKED_METHODS.items():
+        for name in names:
+            assert inspect.iscoroutinefunction(getattr(interface, name, None)), (
+                f"{interface.__name__}.{name}"
+            )
+    return {
+        interface: Mock(**{name: AsyncMock() for name in names})
+        for interface, names in _MOCKED_METHODS.items()
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_mocks(collaborator_mocks):
+    """Clear calls and configured results left over from a previous test."""
+    for mock in collaborator_mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def thought_repository(collaborator_mocks):
+    """Mock thought repository."""
+    return collaborator_mocks[ThoughtRepository]
+
+
+@pytest.fixture(scope="session")
+def semantic_entry_repository(collaborator_mocks):
+    """Mock semantic entry repository."""
+    return collaborator_mocks[SemanticEntryRepository]
+
+
+@pytest.fixture(scope="session")
+def entity_extraction_service(collaborator_mocks):
+    """Mock entity extraction service."""
+    return collaborator_mocks[EntityExtractionService]
+
+
+@pytest.fixture(scope="session")
+def sample_user():
+    """Create a sample user for testing."""
+    return User(
+        id=SAMPLE_USER_ID,
+        email="test@example.com",
+        hashed_password="hashed_password",
+        is_active=True,
+        is_admin=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_search_query():
+    """Create a sample search query."""
+    return SearchQuery(
+        query_text="test query",
+        user_id=str(SAMPLE_USER_ID),
+        pagination=Pagination(page=1, page_size=10),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_search_response():
+    """Create a sample search response."""
+    thought = Thought(
+        id=SAMPLE_THOUGHT_ID,
+        user_id=SAMPLE_USER_ID,
+        content="Test thought content",
+        metadata=ThoughtMetadata(),
+    )
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+    search_result = SearchResult(
+        thought=thought,
+        score=SearchScore(
+            semantic_similarity=0.8,
+            keyword_match=0.7,
+            recency_score=0.6,
+            confidence_score=0.9,
+            final_score=0.75,
+        ),
+        rank=1,
+    )
 
-@pytest_asyncio.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
\ No newline at end of file
+    return SearchResponse(
+        results=[search_result],
+        total_count=1,
+        page=1,
+        page_size=10,
+        query_text="test query",
+        search_time_ms=0,  # Will be updated by use case
+    )
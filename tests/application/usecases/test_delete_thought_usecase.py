@@ -1,31 +1,26 @@
 """Tests for DeleteThoughtUseCase."""
 
 import pytest
-from datetime import datetime
-from unittest.mock import AsyncMock, Mock
-from uuid import uuid4
+from types import SimpleNamespace
+from unittest.mock import call
+from uuid import UUID
 
 from src.application.usecases.delete_thought_usecase import DeleteThoughtUseCase
-from src.domain.entities.thought import Thought, ThoughtMetadata
 from src.domain.exceptions import ThoughtNotFoundError
-from src.domain.repositories.semantic_entry_repository import SemanticEntryRepository
-from src.domain.repositories.thought_repository import ThoughtRepository
 
+pytestmark = pytest.mark.asyncio
 
-class TestDeleteThoughtUseCase:
-    """Test cases for DeleteThoughtUseCase."""
+USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+THOUGHT_ID = UUID("22222222-2222-2222-2222-222222222222")
+OTHER_USER_ID = UUID("33333333-3333-3333-3333-333333333333")
+
+PERMISSION_DENIED_MESSAGE = "User does not have permission to delete this thought"
 
-    @pytest.fixture
-    def thought_repository(self):
-        """Mock thought repository."""
-        return Mock(spec=ThoughtRepository)
 
-    @pytest.fixture
-    def semantic_entry_repository(self):
-        """Mock semantic entry repository."""
-        return Mock(spec=SemanticEntryRepository)
+class TestDeleteThoughtUseCase:
+    """Test cases for DeleteThoughtUseCase."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def use_case(self, thought_repository, semantic_entry_repository):
         """Create use case instance with mocked dependencies."""
         return DeleteThoughtUseCase(
@@ -33,25 +28,17 @@ class TestDeleteThoughtUseCase:
             semantic_entry_repository=semantic_entry_repository,
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def existing_thought(self):
-        """Sample existing thought for testing."""
-        return Thought(
-            id=uuid4(),
-            user_id=uuid4(),
-            content="Thought to be deleted",
-            timestamp=datetime(2023, 1, 1, 10, 0, 0),
-            metadata=ThoughtMetadata(),
-        )
+        """Existing thought; the use case only reads its id and owner."""
+        return SimpleNamespace(id=THOUGHT_ID, user_id=USER_ID)
 
     async def test_deletes_thought_and_semantic_entries_successfully(
         self, use_case, thought_repository, semantic_entry_repository, existing_thought
     ):
         """Test successful deletion of thought and its semantic entries."""
         # Arrange
-        thought_repository.find_by_id = AsyncMock(return_value=existing_thought)
-        semantic_entry_repository.delete_by_thought = AsyncMock()
-        thought_repository.delete = AsyncMock()
+        thought_repository.find_by_id.return_value = existing_thought
 
         # Act
         await use_case.execute(
@@ -60,49 +47,44 @@ class TestDeleteThoughtUseCase:
         )
 
         # Assert
-        thought_repository.find_by_id.assert_called_once_with(existing_thought.id)
-        semantic_entry_repository.delete_by_thought.assert_called_once_with(existing_thought.id)
-        thought_repository.delete.assert_called_once_with(existing_thought.id)
+        assert thought_repository.find_by_id.call_args_list == [call(existing_thought.id)]
+        assert semantic_entry_repository.delete_by_thought.call_args_list == [call(existing_thought.id)]
+        assert thought_repository.delete.call_args_list == [call(existing_thought.id)]
 
     async def test_raises_error_when_thought_not_found(
         self, use_case, thought_repository, semantic_entry_repository
     ):
         """Test error handling when thought is not found."""
         # Arrange
-        thought_id = uuid4()
-        user_id = uuid4()
-        thought_repository.find_by_id = AsyncMock(return_value=None)
+        thought_repository.find_by_id.return_value = None
 
         # Act & Assert
         with pytest.raises(ThoughtNotFoundError) as exc_info:
-            await use_case.execute(thought_id=thought_id, user_id=user_id)
+            await use_case.execute(thought_id=THOUGHT_ID, user_id=USER_ID)
         
-        assert exc_info.value.thought_id == thought_id
+        assert exc_info.value.thought_id == THOUGHT_ID
         
-        thought_repository.find_by_id.assert_called_once_with(thought_id)
-        semantic_entry_repository.delete_by_thought.assert_not_called()
-        thought_repository.delete.assert_not_called()
+        assert thought_repository.find_by_id.call_args_list == [call(THOUGHT_ID)]
+        assert semantic_entry_repository.delete_by_thought.call_count == 0
+        assert thought_repository.delete.call_count == 0
 
     async def test_raises_error_when_user_not_owner(
         self, use_case, thought_repository, semantic_entry_repository, existing_thought
     ):
         """Test error handling when user is not the owner."""
         # Arrange
-        different_user_id = uuid4()
-        thought_repository.find_by_id = AsyncMock(return_value=existing_thought)
+        thought_repository.find_by_id.return_value = existing_thought
 
         # Act & Assert
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match=PERMISSION_DENIED_MESSAGE):
             await use_case.execute(
                 thought_id=existing_thought.id,
-                user_id=different_user_id,
+                user_id=OTHER_USER_ID,
             )
         
-        assert "User does not have permission to delete this thought" in str(exc_info.value)
-        
-        thought_repository.find_by_id.assert_called_once_with(existing_thought.id)
-        semantic_entry_repository.delete_by_thought.assert_not_called()
-        thought_repository.delete.assert_not_called()
+        assert thought_repository.find_by_id.call_args_list == [call(existing_thought.id)]
+        assert semantic_entry_repository.delete_by_thought.call_count == 0
+        assert thought_repository.delete.call_count == 0
 
     async def test_deletes_semantic_entries_before_thought(
         self, use_case, thought_repository, semantic_entry_repository, existing_thought
@@ -117,9 +99,9 @@ class TestDeleteThoughtUseCase:
         def track_thought_delete(*args):
             call_order.append("thought_deleted")
 
-        thought_repository.find_by_id = AsyncMock(return_value=existing_thought)
-        semantic_entry_repository.delete_by_thought = AsyncMock(side_effect=track_semantic_delete)
-        thought_repository.delete = AsyncMock(side_effect=track_thought_delete)
+        thought_repository.find_by_id.return_value = existing_thought
+        semantic_entry_repository.delete_by_thought.side_effect = track_semantic_delete
+        thought_repository.delete.side_effect = track_thought_delete
 
         # Act
         await use_case.execute(
@@ -135,45 +117,35 @@ class TestDeleteThoughtUseCase:
     ):
         """Test handling of semantic entry deletion failure."""
         # Arrange
-        thought_repository.find_by_id = AsyncMock(return_value=existing_thought)
-        semantic_entry_repository.delete_by_thought = AsyncMock(
-            side_effect=Exception("Database connection failed")
-        )
-        thought_repository.delete = AsyncMock()
+        thought_repository.find_by_id.return_value = existing_thought
+        semantic_entry_repository.delete_by_thought.side_effect = Exception("Database connection failed")
 
         # Act & Assert
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match="Database connection failed"):
             await use_case.execute(
                 thought_id=existing_thought.id,
                 user_id=existing_thought.user_id,
             )
         
-        assert "Database connection failed" in str(exc_info.value)
-        
-        thought_repository.find_by_id.assert_called_once_with(existing_thought.id)
-        semantic_entry_repository.delete_by_thought.assert_called_once_with(existing_thought.id)
-        thought_repository.delete.assert_not_called()  # Should not be called if semantic deletion fails
+        assert thought_repository.find_by_id.call_args_list == [call(existing_thought.id)]
+        assert semantic_entry_repository.delete_by_thought.call_args_list == [call(existing_thought.id)]
+        assert thought_repository.delete.call_count == 0  # Should not be called if semantic deletion fails
 
     async def test_handles_thought_deletion_failure(
         self, use_case, thought_repository, semantic_entry_repository, existing_thought
     ):
         """Test handling of thought deletion failure."""
         # Arrange
-        thought_repository.find_by_id = AsyncMock(return_value=existing_thought)
-        semantic_entry_repository.delete_by_thought = AsyncMock()
-        thought_repository.delete = AsyncMock(
-            side_effect=Exception("Database constraint violation")
-        )
+        thought_repository.find_by_id.return_value = existing_thought
+        thought_repository.delete.side_effect = Exception("Database constraint violation")
 
         # Act & Assert
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match="Database constraint violation"):
             await use_case.execute(
                 thought_id=existing_thought.id,
                 user_id=existing_thought.user_id,
             )
         
-        assert "Database constraint violation" in str(exc_info.value)
-        
-        thought_repository.find_by_id.assert_called_once_with(existing_thought.id)
-        semantic_entry_repository.delete_by_thought.assert_called_once_with(existing_thought.id)
-        thought_repository.delete.assert_called_once_with(existing_thought.id)
\ No newline at end of file
+        assert thought_repository.find_by_id.call_args_list == [call(existing_thought.id)]
+        assert semantic_entry_repository.delete_by_thought.call_args_list == [call(existing_thought.id)]
+        assert thought_repository.delete.call_args_list == [call(existing_thought.id)]
\ No newline at end of file
@@ -1,65 +1,43 @@
 """Tests for LoginUserUseCase."""
 
+import re
+
 import pytest
-from unittest.mock import AsyncMock, Mock
-from uuid import uuid4
+from unittest.mock import call
 
 from src.application.usecases.login_user_usecase import LoginUserUseCase, LoginResult
-from src.domain.entities.user import User
 from src.domain.exceptions import AuthenticationError
-from src.domain.services.authentication_service import AuthenticationService
-from src.domain.services.user_management_service import UserManagementService
+from tests.application._stubs import (
+    StubAuthenticationService,
+    StubUserManagementService,
+)
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-class TestLoginUserUseCase:
-    """Test cases for LoginUserUseCase."""
+EMAIL_REQUIRED = re.compile("Email is required")
+PASSWORD_REQUIRED = re.compile("Password is required")
 
-    @pytest.fixture
-    def mock_user_management_service(self):
-        """Create a mock user management service."""
-        return Mock(spec=UserManagementService)
-
-    @pytest.fixture
-    def mock_authentication_service(self):
-        """Create a mock authentication service."""
-        return Mock(spec=AuthenticationService)
-
-    @pytest.fixture
-    def login_usecase(self, mock_user_management_service, mock_authentication_service):
-        """Create a LoginUserUseCase instance with mocked dependencies."""
-        return LoginUserUseCase(
-            user_management_service=mock_user_management_service,
-            authentication_service=mock_authentication_service,
-        )
 
-    @pytest.fixture
-    def sample_user(self):
-        """Create a sample user for testing."""
-        return User(
-            id=uuid4(),
-            email="test@example.com",
-            hashed_password="hashed_password",
-            is_active=True,
-            is_admin=False,
-        )
+class TestLoginUserUseCase:
+    """Test cases for LoginUserUseCase."""
 
-    @pytest.mark.asyncio
-    async def test_execute_successful_login(
-        self,
-        login_usecase,
-        mock_user_management_service,
-        mock_authentication_service,
-        sample_user,
-    ):
+    async def test_execute_successful_login(self, sample_user):
         """Test successful user login."""
         # Arrange
         email = "test@example.com"
         password = "password123"
         access_token = "jwt.access.token"
 
-        mock_user_management_service.authenticate_user = AsyncMock(return_value=sample_user)
-        mock_authentication_service.create_access_token = AsyncMock(return_value=access_token)
-        mock_user_management_service.update_last_login = AsyncMock()
+        user_management_service = StubUserManagementService(
+            authenticate_user_return=sample_user
+        )
+        authentication_service = StubAuthenticationService(
+            create_access_token_return=access_token
+        )
+        login_usecase = LoginUserUseCase(
+            user_management_service=user_management_service,
+            authentication_service=authentication_service,
+        )
 
         # Act
         result = await login_usecase.execute(email, password)
@@ -69,139 +47,121 @@ class TestLoginUserUseCase:
         assert result.user == sample_user
         assert result.access_token == access_token
 
-        mock_user_management_service.authenticate_user.assert_called_once_with(
-            email.lower(), password
-        )
-        mock_authentication_service.create_access_token.assert_called_once_with(sample_user)
-        mock_user_management_service.update_last_login.assert_called_once_with(sample_user.id)
+        assert user_management_service.calls == [
+            call.authenticate_user(email.lower(), password),
+            call.update_last_login(sample_user.id),
+        ]
+        assert authentication_service.calls == [call.create_access_token(sample_user)]
 
-    @pytest.mark.asyncio
-    async def test_execute_email_normalization(
-        self,
-        login_usecase,
-        mock_user_management_service,
-        mock_authentication_service,
-        sample_user,
-    ):
+    async def test_execute_email_normalization(self, sample_user):
         """Test that email is normalized during login."""
         # Arrange
         email = "  TEST@EXAMPLE.COM  "
         password = "password123"
-        access_token = "jwt.access.token"
 
-        mock_user_management_service.authenticate_user = AsyncMock(return_value=sample_user)
-        mock_authentication_service.create_access_token = AsyncMock(return_value=access_token)
-        mock_user_management_service.update_last_login = AsyncMock()
+        user_management_service = StubUserManagementService(
+            authenticate_user_return=sample_user
+        )
+        login_usecase = LoginUserUseCase(
+            user_management_service=user_management_service,
+            authentication_service=StubAuthenticationService(
+                create_access_token_return="jwt.access.token"
+            ),
+        )
 
         # Act
         await login_usecase.execute(email, password)
 
         # Assert
-        mock_user_management_service.authenticate_user.assert_called_once_with(
+        assert user_management_service.calls[0] == call.authenticate_user(
             "test@example.com", password
         )
 
-    @pytest.mark.asyncio
-    async def test_execute_empty_email_error(
+    @pytest.mark.parametrize(
+        "email,password,message",
+        [
+            ("", "password123", EMAIL_REQUIRED),
+            ("   ", "password123", EMAIL_REQUIRED),
+            ("test@example.com", "", PASSWORD_REQUIRED),
+        ],
+        ids=["empty_email", "whitespace_email", "empty_password"],
+    )
+    async def test_execute_validation_errors(
         self,
-        login_usecase,
+        email,
+        password,
+        message,
     ):
-        """Test login with empty email."""
+        """Test login with missing email or password."""
         # Arrange
-        email = ""
-        password = "password123"
-
-        # Act & Assert
-        with pytest.raises(AuthenticationError, match="Email is required"):
-            await login_usecase.execute(email, password)
-
-    @pytest.mark.asyncio
-    async def test_execute_whitespace_email_error(
-        self,
-        login_usecase,
-    ):
-        """Test login with whitespace-only email."""
-        # Arrange
-        email = "   "
-        password = "password123"
-
-        # Act & Assert
-        with pytest.raises(AuthenticationError, match="Email is required"):
-            await login_usecase.execute(email, password)
-
-    @pytest.mark.asyncio
-    async def test_execute_empty_password_error(
-        self,
-        login_usecase,
-    ):
-        """Test login with empty password."""
-        # Arrange
-        email = "test@example.com"
-        password = ""
+        login_usecase = LoginUserUseCase(
+            user_management_service=None,
+            authentication_service=None,
+        )
 
         # Act & Assert
-        with pytest.raises(AuthenticationError, match="Password is required"):
+        with pytest.raises(AuthenticationError, match=message):
             await login_usecase.execute(email, password)
 
-    @pytest.mark.asyncio
-    async def test_execute_invalid_credentials(
-        self,
-        login_usecase,
-        mock_user_management_service,
-    ):
+    async def test_execute_invalid_credentials(self):
         """Test login with invalid credentials."""
         # Arrange
         email = "test@example.com"
         password = "wrong_password"
 
-        mock_user_management_service.authenticate_user = AsyncMock(return_value=None)
+        user_management_service = StubUserManagementService(
+            authenticate_user_return=None
+        )
+        authentication_service = StubAuthenticationService()
+        login_usecase = LoginUserUseCase(
+            user_management_service=user_management_service,
+            authentication_service=authentication_service,
+        )
 
         # Act & Assert
         with pytest.raises(AuthenticationError, match="Invalid email or password"):
             await login_usecase.execute(email, password)
 
-    @pytest.mark.asyncio
-    async def test_execute_authentication_service_error(
-        self,
-        login_usecase,
-        mock_user_management_service,
-        mock_authentication_service,
-        sample_user,
-    ):
+        assert user_management_service.calls == [
+            call.authenticate_user(email, password)
+        ]
+        assert authentication_service.calls == []
+
+    async def test_execute_authentication_service_error(self, sample_user):
         """Test login with authentication service error."""
         # Arrange
         email = "test@example.com"
         password = "password123"
 
-        mock_user_management_service.authenticate_user = AsyncMock(return_value=sample_user)
-        mock_authentication_service.create_access_token = AsyncMock(
-            side_effect=AuthenticationError("Token creation failed")
+        login_usecase = LoginUserUseCase(
+            user_management_service=StubUserManagementService(
+                authenticate_user_return=sample_user
+            ),
+            authentication_service=StubAuthenticationService(
+                create_access_token_raises=AuthenticationError("Token creation failed")
+            ),
         )
 
         # Act & Assert
         with pytest.raises(AuthenticationError):
             await login_usecase.execute(email, password)
 
-    @pytest.mark.asyncio
-    async def test_execute_update_last_login_error(
-        self,
-        login_usecase,
-        mock_user_management_service,
-        mock_authentication_service,
-        sample_user,
-    ):
+    async def test_execute_update_last_login_error(self, sample_user):
         """Test login with last login update error (should not fail login)."""
         # Arrange
         email = "test@example.com"
         password = "password123"
-        access_token = "jwt.access.token"
 
-        mock_user_management_service.authenticate_user = AsyncMock(return_value=sample_user)
-        mock_authentication_service.create_access_token = AsyncMock(return_value=access_token)
-        mock_user_management_service.update_last_login = AsyncMock(
-            side_effect=Exception("Update failed")
+        login_usecase = LoginUserUseCase(
+            user_management_service=StubUserManagementService(
+                authenticate_user_return=sample_user,
+                update_last_login_raises=Exception("Update failed"),
+            ),
+            authentication_service=StubAuthenticationService(
+                create_access_token_return="jwt.access.token"
+            ),
         )
 
         # Act & Assert - login should still succeed even if last login update fails
         with pytest.raises(Exception, match="Update failed"):
-            await login_usecase.execute(email, password)
\ No newline at end of file
+            await login_usecase.execute(email, password)
@@ -1,174 +1,108 @@
 """Tests for RegisterUserUseCase."""
 
+import re
+
 import pytest
-from unittest.mock import AsyncMock, Mock
-from uuid import uuid4
 
 from src.application.usecases.register_user_usecase import RegisterUserUseCase
-from src.domain.entities.user import User
 from src.domain.exceptions import UserAlreadyExistsError, UserRegistrationError
-from src.domain.services.user_management_service import UserManagementService
+from tests.application._stubs import StubUserManagementService
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-class TestRegisterUserUseCase:
-    """Test cases for RegisterUserUseCase."""
+EMAIL_REQUIRED = re.compile("Email is required")
+PASSWORD_TOO_SHORT = re.compile("Password must be at least 8 characters long")
 
-    @pytest.fixture
-    def mock_user_management_service(self):
-        """Create a mock user management service."""
-        return Mock(spec=UserManagementService)
 
-    @pytest.fixture
-    def register_usecase(self, mock_user_management_service):
-        """Create a RegisterUserUseCase instance with mocked dependencies."""
-        return RegisterUserUseCase(
-            user_management_service=mock_user_management_service
-        )
-
-    @pytest.fixture
-    def sample_user(self):
-        """Create a sample user for testing."""
-        return User(
-            id=uuid4(),
-            email="test@example.com",
-            hashed_password="hashed_password",
-            is_active=True,
-            is_admin=False,
-        )
+class TestRegisterUserUseCase:
+    """Test cases for RegisterUserUseCase."""
 
-    @pytest.mark.asyncio
-    async def test_execute_successful_registration(
-        self,
-        register_usecase,
-        mock_user_management_service,
-        sample_user,
-    ):
+    async def test_execute_successful_registration(self, sample_user):
         """Test successful user registration."""
         # Arrange
         email = "test@example.com"
         password = "password123"
-        mock_user_management_service.register_user = AsyncMock(return_value=sample_user)
+        user_management_service = StubUserManagementService(
+            register_user_return=sample_user
+        )
+        register_usecase = RegisterUserUseCase(
+            user_management_service=user_management_service
+        )
 
         # Act
         result = await register_usecase.execute(email, password)
 
         # Assert
         assert result == sample_user
-        mock_user_management_service.register_user.assert_called_once()
-        
+        assert len(user_management_service.calls) == 1
+
         # Check that registration data was created correctly
-        call_args = mock_user_management_service.register_user.call_args[0][0]
-        assert call_args.email == email.lower()
-        assert call_args.password == password
+        registration_data = user_management_service.calls[0].args[0]
+        assert registration_data.email == email.lower()
+        assert registration_data.password == password
 
-    @pytest.mark.asyncio
-    async def test_execute_email_normalization(
-        self,
-        register_usecase,
-        mock_user_management_service,
-        sample_user,
-    ):
+    async def test_execute_email_normalization(self, sample_user):
         """Test that email is normalized (lowercased and trimmed)."""
         # Arrange
         email = "  TEST@EXAMPLE.COM  "
         password = "password123"
-        mock_user_management_service.register_user = AsyncMock(return_value=sample_user)
+        user_management_service = StubUserManagementService(
+            register_user_return=sample_user
+        )
+        register_usecase = RegisterUserUseCase(
+            user_management_service=user_management_service
+        )
 
         # Act
         await register_usecase.execute(email, password)
 
         # Assert
-        call_args = mock_user_management_service.register_user.call_args[0][0]
-        assert call_args.email == "test@example.com"
-
-    @pytest.mark.asyncio
-    async def test_execute_empty_email_error(
-        self,
-        register_usecase,
-    ):
-        """Test registration with empty email."""
-        # Arrange
-        email = ""
-        password = "password123"
-
-        # Act & Assert
-        with pytest.raises(UserRegistrationError, match="Email is required"):
-            await register_usecase.execute(email, password)
-
-    @pytest.mark.asyncio
-    async def test_execute_whitespace_email_error(
-        self,
-        register_usecase,
-    ):
-        """Test registration with whitespace-only email."""
-        # Arrange
-        email = "   "
-        password = "password123"
-
-        # Act & Assert
-        with pytest.raises(UserRegistrationError, match="Email is required"):
-            await register_usecase.execute(email, password)
-
-    @pytest.mark.asyncio
-    async def test_execute_short_password_error(
+        registration_data = user_management_service.calls[0].args[0]
+        assert registration_data.email == "test@example.com"
+
+    @pytest.mark.parametrize(
+        "email,password,message",
+        [
+            ("", "password123", EMAIL_REQUIRED),
+            ("   ", "password123", EMAIL_REQUIRED),
+            ("test@example.com", "short", PASSWORD_TOO_SHORT),
+            ("test@example.com", "", PASSWORD_TOO_SHORT),
+        ],
+        ids=["empty_email", "whitespace_email", "short_password", "empty_password"],
+    )
+    async def test_execute_validation_errors(
         self,
-        register_usecase,
+        email,
+        password,
+        message,
     ):
-        """Test registration with password too short."""
+        """Test registration with invalid email or password."""
         # Arrange
-        email = "test@example.com"
-        password = "short"
+        register_usecase = RegisterUserUseCase(user_management_service=None)
 
         # Act & Assert
-        with pytest.raises(UserRegistrationError, match="Password must be at least 8 characters long"):
+        with pytest.raises(UserRegistrationError, match=message):
             await register_usecase.execute(email, password)
 
-    @pytest.mark.asyncio
-    async def test_execute_empty_password_error(
-        self,
-        register_usecase,
-    ):
-        """Test registration with empty password."""
-        # Arrange
-        email = "test@example.com"
-        password = ""
-
-        # Act & Assert
-        with pytest.raises(UserRegistrationError, match="Password must be at least 8 characters long"):
-            await register_usecase.execute(email, password)
-
-    @pytest.mark.asyncio
-    async def test_execute_user_already_exists_error(
-        self,
-        register_usecase,
-        mock_user_management_service,
-    ):
-        """Test registration when user already exists."""
+    @pytest.mark.parametrize(
+        "error",
+        [
+            UserAlreadyExistsError("test@example.com"),
+            UserRegistrationError("Service error"),
+        ],
+        ids=["user_already_exists", "registration_service_error"],
+    )
+    async def test_execute_propagates_service_errors(self, error):
+        """Test that registration errors from the service are propagated."""
         # Arrange
         email = "test@example.com"
         password = "password123"
-        mock_user_management_service.register_user = AsyncMock(
-            side_effect=UserAlreadyExistsError(email)
+        register_usecase = RegisterUserUseCase(
+            user_management_service=StubUserManagementService(
+                register_user_raises=error
+            )
         )
 
         # Act & Assert
-        with pytest.raises(UserAlreadyExistsError):
+        with pytest.raises(type(error)):
             await register_usecase.execute(email, password)
-
-    @pytest.mark.asyncio
-    async def test_execute_registration_service_error(
-        self,
-        register_usecase,
-        mock_user_management_service,
-    ):
-        """Test registration with service error."""
-        # Arrange
-        email = "test@example.com"
-        password = "password123"
-        mock_user_management_service.register_user = AsyncMock(
-            side_effect=UserRegistrationError("Service error")
-        )
-
-        # Act & Assert
-        with pytest.raises(UserRegistrationError):
-            await register_usecase.execute(email, password)
\ No newline at end of file
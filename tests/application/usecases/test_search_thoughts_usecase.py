@@ -1,125 +1,48 @@
 """Tests for SearchThoughtsUseCase."""
 
 import pytest
-from unittest.mock import AsyncMock, Mock
-from uuid import uuid4
+from unittest.mock import call
+from uuid import UUID
 
 from src.application.usecases.search_thoughts_usecase import SearchThoughtsUseCase
-from src.domain.entities.search_query import SearchQuery, Pagination
-from src.domain.entities.search_result import SearchResponse, SearchResult, SearchScore
-from src.domain.entities.thought import Thought, ThoughtMetadata
 from src.domain.exceptions import SearchError, SearchQueryError
-from src.domain.repositories.search_repository import SearchRepository
-from src.domain.services.search_service import SearchService
+from tests.application._stubs import (
+    StubSearchRepository,
+    StubSearchService,
+)
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-class TestSearchThoughtsUseCase:
-    """Test cases for SearchThoughtsUseCase."""
+USER_ID = UUID("11111111-1111-1111-1111-111111111111")
 
-    @pytest.fixture
-    def mock_search_repository(self):
-        """Create a mock search repository."""
-        return Mock(spec=SearchRepository)
-
-    @pytest.fixture
-    def mock_search_service(self):
-        """Create a mock search service."""
-        return Mock(spec=SearchService)
-
-    @pytest.fixture
-    def search_usecase(self, mock_search_repository, mock_search_service):
-        """Create a SearchThoughtsUseCase instance with mocked dependencies."""
-        return SearchThoughtsUseCase(
-            search_repository=mock_search_repository,
-            search_service=mock_search_service,
-        )
 
-    @pytest.fixture
-    def sample_search_query(self):
-        """Create a sample search query."""
-        return SearchQuery(
-            query_text="test query",
-            user_id=str(uuid4()),
-            pagination=Pagination(page=1, page_size=10),
-        )
-
-    @pytest.fixture
-    def sample_search_response(self):
-        """Create a sample search response."""
-        thought = Thought(
-            id=uuid4(),
-            user_id=uuid4(),
-            content="Test thought content",
-            metadata=ThoughtMetadata(),
-        )
-        
-        search_result = SearchResult(
-            thought=thought,
-            score=SearchScore(
-                semantic_similarity=0.8,
-                keyword_match=0.7,
-                recency_score=0.6,
-                confidence_score=0.9,
-                final_score=0.75,
-            ),
-            rank=1,
-        )
-
-        return SearchResponse(
-            results=[search_result],
-            total_count=1,
-            page=1,
-            page_size=10,
-            query_text="test query",
-            search_time_ms=0,  # Will be updated by use case
-        )
+class TestSearchThoughtsUseCase:
+    """Test cases for SearchThoughtsUseCase."""
 
-    @pytest.mark.asyncio
-    async def test_execute_successful_search(
+    @pytest.mark.parametrize("entry", ["execute", "execute_with_query"])
+    async def test_successful_search(
         self,
-        search_usecase,
-        mock_search_repository,
-        mock_search_service,
         sample_search_query,
         sample_search_response,
+        entry,
     ):
-        """Test successful search execution."""
+        """Test successful search through either use case entry point."""
         # Arrange
-        user_id = uuid4()
+        user_id = USER_ID
         query_text = "test query"
-        
-        mock_search_service.parse_query = AsyncMock(return_value=sample_search_query)
-        mock_search_repository.search = AsyncMock(return_value=sample_search_response)
-
-        # Act
-        result = await search_usecase.execute(query_text, user_id)
 
-        # Assert
-        assert result is not None
-        assert result.query_text == "test query"
-        assert result.total_count == 1
-        assert len(result.results) == 1
-        assert result.search_time_ms >= 0  # Should be updated with actual time
-        
-        mock_search_service.parse_query.assert_called_once_with(
-            query_text=query_text, user_id=str(user_id)
+        search_repository = StubSearchRepository(search_return=sample_search_response)
+        search_service = StubSearchService(parse_query_return=sample_search_query)
+        search_usecase = SearchThoughtsUseCase(
+            search_repository=search_repository,
+            search_service=search_service,
         )
-        mock_search_repository.search.assert_called_once_with(sample_search_query)
-
-    @pytest.mark.asyncio
-    async def test_execute_with_query_successful_search(
-        self,
-        search_usecase,
-        mock_search_repository,
-        sample_search_query,
-        sample_search_response,
-    ):
-        """Test successful search execution with pre-built query."""
-        # Arrange
-        mock_search_repository.search = AsyncMock(return_value=sample_search_response)
 
         # Act
-        result = await search_usecase.execute_with_query(sample_search_query)
+        if entry == "execute":
+            result = await search_usecase.execute(query_text, user_id)
+        else:
+            result = await search_usecase.execute_with_query(sample_search_query)
 
         # Assert
         assert result is not None
@@ -127,116 +50,101 @@ class TestSearchThoughtsUseCase:
         assert result.total_count == 1
         assert len(result.results) == 1
         assert result.search_time_ms >= 0  # Should be updated with actual time
-        
-        mock_search_repository.search.assert_called_once_with(sample_search_query)
 
-    @pytest.mark.asyncio
-    async def test_execute_query_parsing_error(
-        self,
-        search_usecase,
-        mock_search_service,
-    ):
+        if entry == "execute":
+            assert search_service.calls == [
+                call.parse_query(query_text=query_text, user_id=str(user_id))
+            ]
+        else:
+            assert search_service.calls == []
+        assert search_repository.calls == [call.search(sample_search_query)]
+
+    async def test_execute_query_parsing_error(self):
         """Test search execution with query parsing error."""
         # Arrange
-        user_id = uuid4()
+        user_id = USER_ID
         query_text = ""
-        
-        mock_search_service.parse_query = AsyncMock(
-            side_effect=SearchQueryError("Query text cannot be empty")
+
+        search_repository = StubSearchRepository()
+        search_usecase = SearchThoughtsUseCase(
+            search_repository=search_repository,
+            search_service=StubSearchService(
+                parse_query_raises=SearchQueryError("Query text cannot be empty")
+            ),
         )
 
         # Act & Assert
         with pytest.raises(SearchQueryError, match="Query text cannot be empty"):
             await search_usecase.execute(query_text, user_id)
 
-    @pytest.mark.asyncio
-    async def test_execute_search_repository_error(
-        self,
-        search_usecase,
-        mock_search_repository,
-        mock_search_service,
-        sample_search_query,
-    ):
+        assert search_repository.calls == []
+
+    async def test_execute_search_repository_error(self, sample_search_query):
         """Test search execution with repository error."""
         # Arrange
-        user_id = uuid4()
+        user_id = USER_ID
         query_text = "test query"
-        
-        mock_search_service.parse_query = AsyncMock(return_value=sample_search_query)
-        mock_search_repository.search = AsyncMock(
-            side_effect=Exception("Database connection failed")
+
+        search_usecase = SearchThoughtsUseCase(
+            search_repository=StubSearchRepository(
+                search_raises=Exception("Database connection failed")
+            ),
+            search_service=StubSearchService(parse_query_return=sample_search_query),
         )
 
         # Act & Assert
         with pytest.raises(SearchError, match="Search execution failed"):
             await search_usecase.execute(query_text, user_id)
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "limit_args,limit,expected_suggestions",
+        [
+            ((), 5, ["test query", "test content", "test idea"]),
+            ((10,), 10, ["suggestion1", "suggestion2"]),
+        ],
+        ids=["default_limit", "custom_limit"],
+    )
     async def test_get_suggestions_successful(
         self,
-        search_usecase,
-        mock_search_repository,
+        limit_args,
+        limit,
+        expected_suggestions,
     ):
         """Test successful suggestion generation."""
         # Arrange
-        user_id = uuid4()
+        user_id = USER_ID
         query_text = "test"
-        expected_suggestions = ["test query", "test content", "test idea"]
-        
-        mock_search_repository.get_suggestions = AsyncMock(
-            return_value=expected_suggestions
-        )
-
-        # Act
-        result = await search_usecase.get_suggestions(query_text, user_id)
 
-        # Assert
-        assert result == expected_suggestions
-        mock_search_repository.get_suggestions.assert_called_once_with(
-            query_text=query_text, user_id=str(user_id), limit=5
+        search_repository = StubSearchRepository(
+            get_suggestions_return=expected_suggestions
         )
-
-    @pytest.mark.asyncio
-    async def test_get_suggestions_with_custom_limit(
-        self,
-        search_usecase,
-        mock_search_repository,
-    ):
-        """Test suggestion generation with custom limit."""
-        # Arrange
-        user_id = uuid4()
-        query_text = "test"
-        limit = 10
-        expected_suggestions = ["suggestion1", "suggestion2"]
-        
-        mock_search_repository.get_suggestions = AsyncMock(
-            return_value=expected_suggestions
+        search_usecase = SearchThoughtsUseCase(
+            search_repository=search_repository,
+            search_service=StubSearchService(),
         )
 
         # Act
-        result = await search_usecase.get_suggestions(query_text, user_id, limit)
+        result = await search_usecase.get_suggestions(query_text, user_id, *limit_args)
 
         # Assert
         assert result == expected_suggestions
-        mock_search_repository.get_suggestions.assert_called_once_with(
-            query_text=query_text, user_id=str(user_id), limit=limit
-        )
+        assert search_repository.calls == [
+            call.get_suggestions(query_text=query_text, user_id=str(user_id), limit=limit)
+        ]
 
-    @pytest.mark.asyncio
-    async def test_get_suggestions_repository_error(
-        self,
-        search_usecase,
-        mock_search_repository,
-    ):
+    async def test_get_suggestions_repository_error(self):
         """Test suggestion generation with repository error."""
         # Arrange
-        user_id = uuid4()
+        user_id = USER_ID
         query_text = "test"
-        
-        mock_search_repository.get_suggestions = AsyncMock(
-            side_effect=Exception("Database connection failed")
+
+        search_usecase = SearchThoughtsUseCase(
+            search_repository=StubSearchRepository(
+                get_suggestions_raises=Exception("Database connection failed")
+            ),
+            search_service=StubSearchService(),
         )
 
         # Act & Assert
         with pytest.raises(SearchError, match="Suggestion generation failed"):
-            await search_usecase.get_suggestions(query_text, user_id)
\ No newline at end of file
+            await search_usecase.get_suggestions(query_text, user_id)
@@ -2,38 +2,33 @@
 
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, Mock
-from uuid import uuid4
+from unittest.mock import call
+from uuid import UUID
 
 from src.application.usecases.update_thought_usecase import UpdateThoughtUseCase
 from src.domain.entities.enums import EntityType
 from src.domain.entities.semantic_entry import SemanticEntry
 from src.domain.entities.thought import Thought, ThoughtMetadata, GeoLocation
 from src.domain.exceptions import EntityExtractionError, ThoughtNotFoundError
-from src.domain.repositories.semantic_entry_repository import SemanticEntryRepository
-from src.domain.repositories.thought_repository import ThoughtRepository
-from src.domain.services.entity_extraction_service import EntityExtractionService
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-class TestUpdateThoughtUseCase:
-    """Test cases for UpdateThoughtUseCase."""
-
-    @pytest.fixture
-    def thought_repository(self):
-        """Mock thought repository."""
-        return Mock(spec=ThoughtRepository)
+USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+THOUGHT_ID = UUID("22222222-2222-2222-2222-222222222222")
+OTHER_USER_ID = UUID("33333333-3333-3333-3333-333333333333")
+ENTRY_ID = UUID("44444444-4444-4444-4444-444444444444")
+CREATED_AT = datetime(2023, 1, 1, 10, 0, 0)
+LOCATION_METADATA = ThoughtMetadata(
+    location=GeoLocation(latitude=40.7128, longitude=-74.0060),
+    mood="happy",
+)
+MOOD_METADATA = ThoughtMetadata(mood="excited")
 
-    @pytest.fixture
-    def semantic_entry_repository(self):
-        """Mock semantic entry repository."""
-        return Mock(spec=SemanticEntryRepository)
 
-    @pytest.fixture
-    def entity_extraction_service(self):
-        """Mock entity extraction service."""
-        return Mock(spec=EntityExtractionService)
+class TestUpdateThoughtUseCase:
+    """Test cases for UpdateThoughtUseCase."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def use_case(self, thought_repository, semantic_entry_repository, entity_extraction_service):
         """Create use case instance with mocked dependencies."""
         return UpdateThoughtUseCase(
@@ -42,186 +37,151 @@ class TestUpdateThoughtUseCase:
             entity_extraction_service=entity_extraction_service,
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
+    def guard_use_case(self, thought_repository):
+        """Use case for paths that stop at the lookup or ownership check.
+
+        Those paths never reach entity processing, so the semantic entry
+        repository and extraction service are left unset.
+        """
+        return UpdateThoughtUseCase(
+            thought_repository=thought_repository,
+            semantic_entry_repository=None,
+            entity_extraction_service=None,
+        )
+
+    @pytest.fixture(scope="session")
     def existing_thought(self):
-        """Sample existing thought for testing."""
-        return Thought(
-            id=uuid4(),
-            user_id=uuid4(),
+        """Sample existing thought, built without re-running validation."""
+        return Thought.model_construct(
+            id=THOUGHT_ID,
+            user_id=USER_ID,
             content="Original content",
-            timestamp=datetime(2023, 1, 1, 10, 0, 0),
+            timestamp=CREATED_AT,
             metadata=ThoughtMetadata(),
-            created_at=datetime(2023, 1, 1, 10, 0, 0),
-            updated_at=datetime(2023, 1, 1, 10, 0, 0),
+            created_at=CREATED_AT,
+            updated_at=CREATED_AT,
         )
 
-    async def test_updates_thought_content_with_entity_reprocessing(
-        self, use_case, thought_repository, semantic_entry_repository, 
-        entity_extraction_service, existing_thought
+    @pytest.mark.parametrize(
+        "content,metadata,extracted_count",
+        [
+            ("Updated content with new entities", None, 1),
+            (None, LOCATION_METADATA, None),
+            ("New content", MOOD_METADATA, 0),
+            ("Original content", None, None),
+            ("Simple content with no entities", None, 0),
+        ],
+        ids=[
+            "content",
+            "metadata_only",
+            "content_and_metadata",
+            "same_content",
+            "no_new_entities",
+        ],
+    )
+    async def test_updates_thought(
+        self, use_case, thought_repository, semantic_entry_repository,
+        entity_extraction_service, existing_thought, content, metadata, extracted_count
     ):
-        """Test updating thought content with entity re-processing."""
+        """Test thought updates; entities are re-extracted only when content changes.
+
+        ``extracted_count`` is None when no re-processing is expected, otherwise
+        the number of entities the extraction service returns.
+        """
         # Arrange
-        new_content = "Updated content with new entities"
         new_semantic_entries = [
             SemanticEntry(
-                id=uuid4(),
+                id=ENTRY_ID,
                 thought_id=existing_thought.id,
                 entity_type=EntityType.ACTIVITY,
                 entity_value="updated",
                 confidence=0.9,
                 context="Updated content",
             )
-        ]
+        ] * (extracted_count or 0)
 
-        thought_repository.find_by_id = AsyncMock(return_value=existing_thought)
-        semantic_entry_repository.delete_by_thought = AsyncMock()
-        entity_extraction_service.extract_entities = AsyncMock(return_value=new_semantic_entries)
-        semantic_entry_repository.save_many = AsyncMock(return_value=new_semantic_entries)
-        
-        updated_thought = existing_thought.model_copy(
-            update={
-                "content": new_content,
-                "semantic_entries": new_semantic_entries,
-                "updated_at": datetime.now(),
-            }
-        )
-        thought_repository.update = AsyncMock(return_value=updated_thought)
+        thought_repository.find_by_id.return_value = existing_thought
+        thought_repository.update.side_effect = lambda thought: thought
+        entity_extraction_service.extract_entities.return_value = new_semantic_entries
+        semantic_entry_repository.save_many.return_value = new_semantic_entries
 
-        # Act
-        result = await use_case.execute(
-            thought_id=existing_thought.id,
-            user_id=existing_thought.user_id,
-            content=new_content,
-        )
-
-        # Assert
-        assert result.content == new_content
-        assert len(result.semantic_entries) == 1
-        
-        thought_repository.find_by_id.assert_called_once_with(existing_thought.id)
-        semantic_entry_repository.delete_by_thought.assert_called_once_with(existing_thought.id)
-        entity_extraction_service.extract_entities.assert_called_once_with(
-            content=new_content,
-            thought_id=existing_thought.id,
-            metadata=existing_thought.metadata,
-        )
-        semantic_entry_repository.save_many.assert_called_once_with(new_semantic_entries)
-        thought_repository.update.assert_called_once()
-
-    async def test_updates_thought_metadata_without_entity_reprocessing(
-        self, use_case, thought_repository, semantic_entry_repository, 
-        entity_extraction_service, existing_thought
-    ):
-        """Test updating thought metadata without entity re-processing."""
-        # Arrange
-        new_metadata = ThoughtMetadata(
-            location=GeoLocation(latitude=40.7128, longitude=-74.0060),
-            mood="happy"
-        )
-
-        thought_repository.find_by_id = AsyncMock(return_value=existing_thought)
-        updated_thought = existing_thought.model_copy(
-            update={"metadata": new_metadata, "updated_at": datetime.now()}
-        )
-        thought_repository.update = AsyncMock(return_value=updated_thought)
+        expected_content = content if content is not None else existing_thought.content
+        expected_metadata = metadata if metadata is not None else existing_thought.metadata
 
         # Act
         result = await use_case.execute(
             thought_id=existing_thought.id,
             user_id=existing_thought.user_id,
-            metadata=new_metadata,
+            content=content,
+            metadata=metadata,
         )
 
         # Assert
-        assert result.metadata == new_metadata
-        assert result.content == existing_thought.content  # Content unchanged
-        
-        thought_repository.find_by_id.assert_called_once_with(existing_thought.id)
-        semantic_entry_repository.delete_by_thought.assert_not_called()
-        entity_extraction_service.extract_entities.assert_not_called()
-        semantic_entry_repository.save_many.assert_not_called()
-        thought_repository.update.assert_called_once()
-
-    async def test_updates_both_content_and_metadata(
-        self, use_case, thought_repository, semantic_entry_repository, 
-        entity_extraction_service, existing_thought
-    ):
-        """Test updating both content and metadata."""
-        # Arrange
-        new_content = "New content"
-        new_metadata = ThoughtMetadata(mood="excited")
-        new_semantic_entries = []
-
-        thought_repository.find_by_id = AsyncMock(return_value=existing_thought)
-        semantic_entry_repository.delete_by_thought = AsyncMock()
-        entity_extraction_service.extract_entities = AsyncMock(return_value=new_semantic_entries)
-        
-        updated_thought = existing_thought.model_copy(
-            update={
-                "content": new_content,
-                "metadata": new_metadata,
-                "semantic_entries": new_semantic_entries,
-                "updated_at": datetime.now(),
-            }
-        )
-        thought_repository.update = AsyncMock(return_value=updated_thought)
-
-        # Act
-        result = await use_case.execute(
-            thought_id=existing_thought.id,
-            user_id=existing_thought.user_id,
-            content=new_content,
-            metadata=new_metadata,
-        )
-
-        # Assert
-        assert result.content == new_content
-        assert result.metadata == new_metadata
-        
-        entity_extraction_service.extract_entities.assert_called_once_with(
-            content=new_content,
-            thought_id=existing_thought.id,
-            metadata=new_metadata,
-        )
+        assert result.content == expected_content
+        assert result.metadata == expected_metadata
+        assert thought_repository.find_by_id.call_args_list == [call(existing_thought.id)]
+        assert thought_repository.update.call_count == 1
+
+        if extracted_count is None:
+            assert result.semantic_entries == existing_thought.semantic_entries
+            assert semantic_entry_repository.delete_by_thought.call_count == 0
+            assert entity_extraction_service.extract_entities.call_count == 0
+            assert semantic_entry_repository.save_many.call_count == 0
+            return
+
+        assert result.semantic_entries == new_semantic_entries
+        assert semantic_entry_repository.delete_by_thought.call_args_list == [
+            call(existing_thought.id)
+        ]
+        assert entity_extraction_service.extract_entities.call_args_list == [
+            call(
+                content=expected_content,
+                thought_id=existing_thought.id,
+                metadata=expected_metadata,
+            )
+        ]
+        expected_save_calls = [call(new_semantic_entries)] if extracted_count else []
+        assert semantic_entry_repository.save_many.call_args_list == expected_save_calls
 
     async def test_raises_error_when_thought_not_found(
-        self, use_case, thought_repository
+        self, guard_use_case, thought_repository
     ):
         """Test error handling when thought is not found."""
         # Arrange
-        thought_id = uuid4()
-        user_id = uuid4()
-        thought_repository.find_by_id = AsyncMock(return_value=None)
+        thought_id = THOUGHT_ID
+        user_id = USER_ID
+        thought_repository.find_by_id.return_value = None
 
         # Act & Assert
         with pytest.raises(ThoughtNotFoundError) as exc_info:
-            await use_case.execute(
+            await guard_use_case.execute(
                 thought_id=thought_id,
                 user_id=user_id,
                 content="New content",
             )
         
         assert exc_info.value.thought_id == thought_id
-        thought_repository.find_by_id.assert_called_once_with(thought_id)
+        assert thought_repository.find_by_id.call_args_list == [call(thought_id)]
 
     async def test_raises_error_when_user_not_owner(
-        self, use_case, thought_repository, existing_thought
+        self, guard_use_case, thought_repository, existing_thought
     ):
         """Test error handling when user is not the owner."""
         # Arrange
-        different_user_id = uuid4()
-        thought_repository.find_by_id = AsyncMock(return_value=existing_thought)
+        different_user_id = OTHER_USER_ID
+        thought_repository.find_by_id.return_value = existing_thought
 
         # Act & Assert
         with pytest.raises(ValueError) as exc_info:
-            await use_case.execute(
+            await guard_use_case.execute(
                 thought_id=existing_thought.id,
                 user_id=different_user_id,
                 content="New content",
             )
         
         assert "User does not have permission to update this thought" in str(exc_info.value)
-        thought_repository.find_by_id.assert_called_once_with(existing_thought.id)
+        assert thought_repository.find_by_id.call_args_list == [call(existing_thought.id)]
 
     async def test_handles_entity_extraction_failure(
         self, use_case, thought_repository, semantic_entry_repository, 
@@ -230,10 +190,9 @@ class TestUpdateThoughtUseCase:
         """Test handling of entity extraction failure."""
         # Arrange
         new_content = "New content"
-        thought_repository.find_by_id = AsyncMock(return_value=existing_thought)
-        semantic_entry_repository.delete_by_thought = AsyncMock()
-        entity_extraction_service.extract_entities = AsyncMock(
-            side_effect=Exception("LLM service unavailable")
+        thought_repository.find_by_id.return_value = existing_thought
+        entity_extraction_service.extract_entities.side_effect = Exception(
+            "LLM service unavailable"
         )
 
         # Act & Assert
@@ -247,69 +206,7 @@ class TestUpdateThoughtUseCase:
         assert "Failed to extract entities" in str(exc_info.value)
         assert "LLM service unavailable" in str(exc_info.value)
         
-        semantic_entry_repository.delete_by_thought.assert_called_once_with(existing_thought.id)
-        entity_extraction_service.extract_entities.assert_called_once()
-
-    async def test_handles_same_content_update_gracefully(
-        self, use_case, thought_repository, semantic_entry_repository, 
-        entity_extraction_service, existing_thought
-    ):
-        """Test updating with the same content (should not trigger re-processing)."""
-        # Arrange
-        same_content = existing_thought.content
-        thought_repository.find_by_id = AsyncMock(return_value=existing_thought)
-        
-        updated_thought = existing_thought.model_copy(update={"updated_at": datetime.now()})
-        thought_repository.update = AsyncMock(return_value=updated_thought)
-
-        # Act
-        result = await use_case.execute(
-            thought_id=existing_thought.id,
-            user_id=existing_thought.user_id,
-            content=same_content,
-        )
-
-        # Assert
-        assert result.content == same_content
-        
-        # Should not trigger entity re-processing since content didn't change
-        semantic_entry_repository.delete_by_thought.assert_not_called()
-        entity_extraction_service.extract_entities.assert_not_called()
-        semantic_entry_repository.save_many.assert_not_called()
-        thought_repository.update.assert_called_once()
-
-    async def test_updates_thought_with_no_new_entities(
-        self, use_case, thought_repository, semantic_entry_repository, 
-        entity_extraction_service, existing_thought
-    ):
-        """Test updating thought when no new entities are extracted."""
-        # Arrange
-        new_content = "Simple content with no entities"
-        thought_repository.find_by_id = AsyncMock(return_value=existing_thought)
-        semantic_entry_repository.delete_by_thought = AsyncMock()
-        entity_extraction_service.extract_entities = AsyncMock(return_value=[])
-        
-        updated_thought = existing_thought.model_copy(
-            update={
-                "content": new_content,
-                "semantic_entries": [],
-                "updated_at": datetime.now(),
-            }
-        )
-        thought_repository.update = AsyncMock(return_value=updated_thought)
-
-        # Act
-        result = await use_case.execute(
-            thought_id=existing_thought.id,
-            user_id=existing_thought.user_id,
-            content=new_content,
-        )
-
-        # Assert
-        assert result.content == new_content
-        assert len(result.semantic_entries) == 0
-        
-        semantic_entry_repository.delete_by_thought.assert_called_once_with(existing_thought.id)
-        entity_extraction_service.extract_entities.assert_called_once()
-        semantic_entry_repository.save_many.assert_not_called()
-        thought_repository.update.assert_called_once()
\ No newline at end of file
+        assert semantic_entry_repository.delete_by_thought.call_args_list == [
+            call(existing_thought.id)
+        ]
+        assert entity_extraction_service.extract_entities.call_count == 1
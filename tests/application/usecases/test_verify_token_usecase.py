@@ -1,30 +1,33 @@
 """Tests for VerifyTokenUseCase."""
 
 import pytest
-from unittest.mock import AsyncMock, Mock
-from uuid import uuid4
+from unittest.mock import AsyncMock, Mock, call
 
 from src.application.usecases.verify_token_usecase import VerifyTokenUseCase
-from src.domain.entities.user import User
 from src.domain.exceptions import InvalidTokenError
 from src.domain.services.authentication_service import AuthenticationService, TokenData
 from src.domain.services.user_management_service import UserManagementService
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+_AUTHENTICATION_SPEC = dir(AuthenticationService)
+_USER_MANAGEMENT_SPEC = dir(UserManagementService)
+
 
 class TestVerifyTokenUseCase:
     """Test cases for VerifyTokenUseCase."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_authentication_service(self):
         """Create a mock authentication service."""
-        return Mock(spec=AuthenticationService)
+        return Mock(spec=_AUTHENTICATION_SPEC, verify_token=AsyncMock())
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_user_management_service(self):
         """Create a mock user management service."""
-        return Mock(spec=UserManagementService)
+        return Mock(spec=_USER_MANAGEMENT_SPEC, get_user_by_id=AsyncMock())
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def verify_token_usecase(self, mock_authentication_service, mock_user_management_service):
         """Create a VerifyTokenUseCase instance with mocked dependencies."""
         return VerifyTokenUseCase(
@@ -32,18 +35,13 @@ class TestVerifyTokenUseCase:
             user_management_service=mock_user_management_service,
         )
 
-    @pytest.fixture
-    def sample_user(self):
-        """Create a sample user for testing."""
-        return User(
-            id=uuid4(),
-            email="test@example.com",
-            hashed_password="hashed_password",
-            is_active=True,
-            is_admin=False,
-        )
+    @pytest.fixture(autouse=True)
+    def reset_service_mocks(self, mock_authentication_service, mock_user_management_service):
+        """Clear calls and results left over from a previous test."""
+        for mock in (mock_authentication_service, mock_user_management_service):
+            mock.reset_mock(return_value=True, side_effect=True)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_token_data(self, sample_user):
         """Create sample token data."""
         return TokenData(
@@ -52,114 +50,68 @@ class TestVerifyTokenUseCase:
             is_admin=sample_user.is_admin,
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("is_admin", [False, True], ids=["regular_user", "admin_user"])
     async def test_execute_successful_verification(
         self,
         verify_token_usecase,
         mock_authentication_service,
         mock_user_management_service,
         sample_user,
-        sample_token_data,
+        is_admin,
     ):
-        """Test successful token verification."""
+        """Test successful token verification for regular and admin users."""
         # Arrange
         token = "valid.jwt.token"
-        mock_authentication_service.verify_token = AsyncMock(return_value=sample_token_data)
-        mock_user_management_service.get_user_by_id = AsyncMock(return_value=sample_user)
+        user = sample_user.model_copy(update={"is_admin": is_admin})
+        mock_authentication_service.verify_token.return_value = TokenData(
+            user_id=user.id,
+            email=user.email,
+            is_admin=is_admin,
+        )
+        mock_user_management_service.get_user_by_id.return_value = user
 
         # Act
         result = await verify_token_usecase.execute(token)
 
         # Assert
-        assert result == sample_user
-        mock_authentication_service.verify_token.assert_called_once_with(token)
-        mock_user_management_service.get_user_by_id.assert_called_once_with(sample_user.id)
-
-    @pytest.mark.asyncio
-    async def test_execute_invalid_token(
-        self,
-        verify_token_usecase,
-        mock_authentication_service,
-    ):
-        """Test verification with invalid token."""
-        # Arrange
-        token = "invalid.jwt.token"
-        mock_authentication_service.verify_token = AsyncMock(
-            side_effect=InvalidTokenError("Invalid token")
-        )
-
-        # Act & Assert
-        with pytest.raises(InvalidTokenError):
-            await verify_token_usecase.execute(token)
-
-    @pytest.mark.asyncio
-    async def test_execute_user_not_found(
-        self,
-        verify_token_usecase,
-        mock_authentication_service,
-        mock_user_management_service,
-        sample_token_data,
-    ):
-        """Test verification when user no longer exists."""
-        # Arrange
-        token = "valid.jwt.token"
-        mock_authentication_service.verify_token = AsyncMock(return_value=sample_token_data)
-        mock_user_management_service.get_user_by_id = AsyncMock(return_value=None)
-
-        # Act & Assert
-        with pytest.raises(InvalidTokenError, match="User associated with token no longer exists"):
-            await verify_token_usecase.execute(token)
-
-    @pytest.mark.asyncio
-    async def test_execute_user_deactivated(
+        assert result == user
+        assert result.is_admin is is_admin
+        assert mock_authentication_service.verify_token.call_args_list == [call(token)]
+        assert mock_user_management_service.get_user_by_id.call_args_list == [
+            call(user.id)
+        ]
+
+    @pytest.mark.parametrize(
+        "token_error,user_update,message",
+        [
+            (InvalidTokenError("Invalid token"), None, "Invalid token"),
+            (None, None, "User associated with token no longer exists"),
+            (None, {"is_active": False}, "User account is deactivated"),
+        ],
+        ids=["invalid_token", "user_not_found", "user_deactivated"],
+    )
+    async def test_execute_rejects_token(
         self,
         verify_token_usecase,
         mock_authentication_service,
         mock_user_management_service,
         sample_user,
         sample_token_data,
+        token_error,
+        user_update,
+        message,
     ):
-        """Test verification when user is deactivated."""
+        """Test verification of invalid tokens and missing or deactivated users."""
         # Arrange
-        token = "valid.jwt.token"
-        deactivated_user = sample_user.model_copy(update={"is_active": False})
-        
-        mock_authentication_service.verify_token = AsyncMock(return_value=sample_token_data)
-        mock_user_management_service.get_user_by_id = AsyncMock(return_value=deactivated_user)
+        token = "some.jwt.token"
+        if token_error is not None:
+            mock_authentication_service.verify_token.side_effect = token_error
+        else:
+            mock_authentication_service.verify_token.return_value = sample_token_data
+        mock_user_management_service.get_user_by_id.return_value = (
+            sample_user.model_copy(update=user_update) if user_update else None
+        )
 
         # Act & Assert
-        with pytest.raises(InvalidTokenError, match="User account is deactivated"):
+        with pytest.raises(InvalidTokenError, match=message):
             await verify_token_usecase.execute(token)
-
-    @pytest.mark.asyncio
-    async def test_execute_admin_user(
-        self,
-        verify_token_usecase,
-        mock_authentication_service,
-        mock_user_management_service,
-    ):
-        """Test verification with admin user."""
-        # Arrange
-        token = "valid.jwt.token"
-        admin_user = User(
-            id=uuid4(),
-            email="admin@example.com",
-            hashed_password="hashed_password",
-            is_active=True,
-            is_admin=True,
-        )
-        admin_token_data = TokenData(
-            user_id=admin_user.id,
-            email=admin_user.email,
-            is_admin=True,
-        )
-
-        mock_authentication_service.verify_token = AsyncMock(return_value=admin_token_data)
-        mock_user_management_service.get_user_by_id = AsyncMock(return_value=admin_user)
-
-        # Act
-        result = await verify_token_usecase.execute(token)
-
-        # Assert
-        assert result == admin_user
-        assert result.is_admin is True
\ No newline at end of file
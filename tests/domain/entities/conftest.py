@@ -0,0 +1,18 @@
+"""Shared fixtures for domain entity tests."""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def ids():
+    """Deterministic UUIDs, built once per module instead of per test."""
+    return [uuid.UUID(int=i) for i in range(1, 33)]
+
+
+@pytest.fixture(scope="session")
+def now():
+    """A fixed timestamp for tests that only need some point in time."""
+    return datetime(2024, 1, 1, 12, 0, 0)
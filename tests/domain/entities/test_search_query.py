@@ -15,11 +15,47 @@ from src.domain.entities.search_query import (
 )
 
 
-def test_date_range_creation():
+@pytest.fixture(scope="module")
+def sample_date_range(now):
+    """Create a date range shared by tests that only read it."""
+    return DateRange(
+        start_date=now - timedelta(days=7),
+        end_date=now,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_entity_filter():
+    """Create an entity filter shared by tests that only read it."""
+    return EntityFilter(
+        entity_types=[EntityType.PERSON],
+        entity_values=["John Doe"],
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_sort_options():
+    """Create sort options shared by tests that only read them."""
+    return SortOptions(
+        sort_by="date",
+        sort_order="asc",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_pagination():
+    """Create pagination shared by tests that only read it."""
+    return Pagination(
+        page=2,
+        page_size=20,
+    )
+
+
+def test_date_range_creation(now):
     """Test that a date range can be created with valid data."""
     # Arrange
-    start_date = datetime.now() - timedelta(days=7)
-    end_date = datetime.now()
+    start_date = now - timedelta(days=7)
+    end_date = now
 
     # Act
     date_range = DateRange(
@@ -32,22 +68,6 @@ def test_date_range_creation():
     assert date_range.end_date == end_date
 
 
-def test_date_range_validation():
-    """Test that a date range validates end_date is after start_date."""
-    # Arrange
-    start_date = datetime.now()
-    end_date = datetime.now() - timedelta(days=7)  # End date before start date
-
-    # Act & Assert
-    with pytest.raises(ValidationError) as exc_info:
-        DateRange(
-            start_date=start_date,
-            end_date=end_date,
-        )
-
-    assert "end_date must be after start_date" in str(exc_info.value)
-
-
 def test_entity_filter_creation():
     """Test that an entity filter can be created with valid data."""
     # Arrange
@@ -88,20 +108,6 @@ def test_sort_options_default_values():
     assert sort_options.sort_order == "desc"
 
 
-def test_sort_options_validation():
-    """Test that sort options validate sort_by and sort_order."""
-    # Arrange & Act & Assert
-    with pytest.raises(ValidationError) as exc_info:
-        SortOptions(sort_by="invalid")
-
-    assert "sort_by must be one of" in str(exc_info.value)
-
-    with pytest.raises(ValidationError) as exc_info:
-        SortOptions(sort_order="invalid")
-
-    assert "sort_order must be one of" in str(exc_info.value)
-
-
 def test_pagination_creation():
     """Test that pagination can be created with valid data."""
     # Arrange & Act
@@ -125,55 +131,54 @@ def test_pagination_default_values():
     assert pagination.page_size == 10
 
 
-def test_pagination_validation():
-    """Test that pagination validates page and page_size."""
+@pytest.mark.parametrize(
+    "model,kwargs,expected_message",
+    [
+        (
+            DateRange,
+            {"start_date": datetime(2024, 1, 8), "end_date": datetime(2024, 1, 1)},
+            "end_date must be after start_date",
+        ),
+        (SortOptions, {"sort_by": "invalid"}, "sort_by must be one of"),
+        (SortOptions, {"sort_order": "invalid"}, "sort_order must be one of"),
+        (Pagination, {"page": 0}, "page"),
+        (Pagination, {"page_size": 0}, "page_size"),
+        (Pagination, {"page_size": 101}, "page_size"),
+    ],
+    ids=[
+        "date_range_end_before_start",
+        "sort_by",
+        "sort_order",
+        "page_zero",
+        "page_size_zero",
+        "page_size_too_large",
+    ],
+)
+def test_validation_errors(model, kwargs, expected_message):
+    """Test that date ranges, sort options and pagination reject invalid values."""
     # Arrange & Act & Assert
     with pytest.raises(ValidationError) as exc_info:
-        Pagination(page=0)
+        model(**kwargs)
 
-    assert "page" in str(exc_info.value)
+    assert expected_message in str(exc_info.value)
 
-    with pytest.raises(ValidationError) as exc_info:
-        Pagination(page_size=0)
-
-    assert "page_size" in str(exc_info.value)
-
-    with pytest.raises(ValidationError) as exc_info:
-        Pagination(page_size=101)
 
-    assert "page_size" in str(exc_info.value)
-
-
-def test_search_query_creation():
+def test_search_query_creation(
+    sample_date_range, sample_entity_filter, sample_sort_options, sample_pagination
+):
     """Test that a search query can be created with valid data."""
     # Arrange
     query_text = "test query"
     user_id = "user123"
-    date_range = DateRange(
-        start_date=datetime.now() - timedelta(days=7),
-        end_date=datetime.now(),
-    )
-    entity_filter = EntityFilter(
-        entity_types=[EntityType.PERSON],
-        entity_values=["John Doe"],
-    )
-    sort_options = SortOptions(
-        sort_by="date",
-        sort_order="asc",
-    )
-    pagination = Pagination(
-        page=2,
-        page_size=20,
-    )
 
     # Act
     search_query = SearchQuery(
         query_text=query_text,
         user_id=user_id,
-        date_range=date_range,
-        entity_filter=entity_filter,
-        sort_options=sort_options,
-        pagination=pagination,
+        date_range=sample_date_range,
+        entity_filter=sample_entity_filter,
+        sort_options=sample_sort_options,
+        pagination=sample_pagination,
         include_raw_content=False,
         highlight_matches=False,
     )
@@ -181,10 +186,10 @@ def test_search_query_creation():
     # Assert
     assert search_query.query_text == query_text
     assert search_query.user_id == user_id
-    assert search_query.date_range == date_range
-    assert search_query.entity_filter == entity_filter
-    assert search_query.sort_options == sort_options
-    assert search_query.pagination == pagination
+    assert search_query.date_range == sample_date_range
+    assert search_query.entity_filter == sample_entity_filter
+    assert search_query.sort_options == sample_sort_options
+    assert search_query.pagination == sample_pagination
     assert search_query.include_raw_content is False
     assert search_query.highlight_matches is False
 
@@ -1,8 +1,5 @@
 """Tests for the SemanticEntry domain entity."""
 
-import uuid
-from datetime import datetime
-
 import pytest
 from pydantic import ValidationError
 
@@ -10,15 +7,15 @@ from src.domain.entities.enums import EntityType
 from src.domain.entities.semantic_entry import Relationship, SemanticEntry
 
 
-def test_relationship_creation():
+def test_relationship_creation(ids, now):
     """Test that a relationship can be created with valid data."""
     # Arrange
-    relationship_id = uuid.uuid4()
-    source_entity_id = uuid.uuid4()
-    target_entity_id = uuid.uuid4()
+    relationship_id = ids[0]
+    source_entity_id = ids[1]
+    target_entity_id = ids[2]
     relationship_type = "mentions"
     strength = 0.8
-    created_at = datetime.now()
+    created_at = now
 
     # Act
     relationship = Relationship(
@@ -39,12 +36,12 @@ def test_relationship_creation():
     assert relationship.created_at == created_at
 
 
-def test_relationship_strength_validation():
+def test_relationship_strength_validation(ids):
     """Test that relationship strength is validated to be between 0 and 1."""
     # Arrange
-    relationship_id = uuid.uuid4()
-    source_entity_id = uuid.uuid4()
-    target_entity_id = uuid.uuid4()
+    relationship_id = ids[0]
+    source_entity_id = ids[1]
+    target_entity_id = ids[2]
 
     # Act & Assert - Test with strength < 0
     with pytest.raises(ValidationError) as exc_info:
@@ -71,17 +68,44 @@ def test_relationship_strength_validation():
     assert "strength" in str(exc_info.value)
 
 
-def test_semantic_entry_creation():
+
+def test_relationship_round_trips_through_model_dump(ids, now):
+    """Test that a relationship survives model_dump and model_validate."""
+    relationship = Relationship(
+        id=ids[0],
+        source_entity_id=ids[1],
+        target_entity_id=ids[2],
+        relationship_type="mentions",
+        strength=0.8,
+        created_at=now,
+    )
+
+    assert Relationship.model_validate(relationship.model_dump()) == relationship
+
+
+def test_relationship_rejects_unknown_fields(ids):
+    """Test that a relationship does not accept fields it does not define."""
+    with pytest.raises(ValidationError, match="extra"):
+        Relationship(
+            id=ids[0],
+            source_entity_id=ids[1],
+            target_entity_id=ids[2],
+            relationship_type="mentions",
+            strength=0.8,
+            weight=1.0,
+        )
+
+def test_semantic_entry_creation(ids, now):
     """Test that a semantic entry can be created with valid data."""
     # Arrange
-    entry_id = uuid.uuid4()
-    thought_id = uuid.uuid4()
+    entry_id = ids[0]
+    thought_id = ids[1]
     entity_type = EntityType.PERSON
     entity_value = "John Doe"
     confidence = 0.95
     context = "I met with John Doe yesterday"
     embedding = [0.1, 0.2, 0.3, 0.4]
-    extracted_at = datetime.now()
+    extracted_at = now
 
     # Act
     semantic_entry = SemanticEntry(
@@ -107,16 +131,16 @@ def test_semantic_entry_creation():
     assert semantic_entry.relationships == []
 
 
-def test_semantic_entry_with_relationships():
+def test_semantic_entry_with_relationships(ids):
     """Test that a semantic entry can be created with relationships."""
     # Arrange
-    entry_id = uuid.uuid4()
-    thought_id = uuid.uuid4()
+    entry_id = ids[0]
+    thought_id = ids[1]
 
     relationship = Relationship(
-        id=uuid.uuid4(),
+        id=ids[2],
         source_entity_id=entry_id,
-        target_entity_id=uuid.uuid4(),
+        target_entity_id=ids[3],
         relationship_type="mentions",
         strength=0.8,
     )
@@ -137,11 +161,11 @@ def test_semantic_entry_with_relationships():
     assert semantic_entry.relationships[0] == relationship
 
 
-def test_semantic_entry_empty_entity_value():
+def test_semantic_entry_empty_entity_value(ids):
     """Test that a semantic entry cannot be created with an empty entity value."""
     # Arrange
-    entry_id = uuid.uuid4()
-    thought_id = uuid.uuid4()
+    entry_id = ids[0]
+    thought_id = ids[1]
 
     # Act & Assert
     with pytest.raises(ValidationError) as exc_info:
@@ -157,11 +181,11 @@ def test_semantic_entry_empty_entity_value():
     assert "Entity value cannot be empty" in str(exc_info.value)
 
 
-def test_semantic_entry_confidence_validation():
+def test_semantic_entry_confidence_validation(ids):
     """Test that confidence is validated to be between 0 and 1."""
     # Arrange
-    entry_id = uuid.uuid4()
-    thought_id = uuid.uuid4()
+    entry_id = ids[0]
+    thought_id = ids[1]
 
     # Act & Assert - Test with confidence < 0
     with pytest.raises(ValidationError) as exc_info:
@@ -1,8 +1,5 @@
 """Tests for the Thought domain entity."""
 
-import uuid
-from datetime import datetime
-
 import pytest
 from pydantic import ValidationError
 
@@ -14,13 +11,13 @@ from src.domain.entities.thought import (
 )
 
 
-def test_thought_creation():
+def test_thought_creation(ids, now):
     """Test that a thought can be created with valid data."""
     # Arrange
-    thought_id = uuid.uuid4()
-    user_id = uuid.uuid4()
+    thought_id = ids[0]
+    user_id = ids[1]
     content = "This is a test thought"
-    timestamp = datetime.now()
+    timestamp = now
 
     # Act
     thought = Thought(
@@ -39,11 +36,11 @@ def test_thought_creation():
     assert thought.semantic_entries == []
 
 
-def test_thought_with_metadata():
+def test_thought_with_metadata(ids):
     """Test that a thought can be created with metadata."""
     # Arrange
-    thought_id = uuid.uuid4()
-    user_id = uuid.uuid4()
+    thought_id = ids[0]
+    user_id = ids[1]
     content = "This is a test thought with metadata"
 
     location = GeoLocation(
@@ -82,11 +79,11 @@ def test_thought_with_metadata():
     assert thought.metadata.custom == {"key1": "value1", "key2": "value2"}
 
 
-def test_thought_empty_content():
+def test_thought_empty_content(ids):
     """Test that a thought cannot be created with empty content."""
     # Arrange
-    thought_id = uuid.uuid4()
-    user_id = uuid.uuid4()
+    thought_id = ids[0]
+    user_id = ids[1]
 
     # Act & Assert
     with pytest.raises(ValidationError) as exc_info:
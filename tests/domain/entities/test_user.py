@@ -9,15 +9,15 @@ from pydantic import ValidationError
 from src.domain.entities.user import User
 
 
-def test_user_creation():
+def test_user_creation(now):
     """Test that a user can be created with valid data."""
     # Arrange
     user_id = uuid.uuid4()
     email = "test@example.com"
     hashed_password = "hashed_password_string"
-    created_at = datetime.now()
-    updated_at = datetime.now()
-    last_login = datetime.now()
+    created_at = now
+    updated_at = now
+    last_login = now
 
     # Act
     user = User(
@@ -40,10 +40,10 @@ def test_user_creation():
     assert user.last_login == last_login
 
 
-def test_user_default_values():
+def test_user_default_values(ids):
     """Test that a user has correct default values."""
     # Arrange
-    user_id = uuid.uuid4()
+    user_id = ids[0]
     email = "test@example.com"
     hashed_password = "hashed_password_string"
 
@@ -62,10 +62,10 @@ def test_user_default_values():
     assert isinstance(user.updated_at, datetime)
 
 
-def test_user_admin_flag():
+def test_user_admin_flag(ids):
     """Test that a user can be created as an admin."""
     # Arrange
-    user_id = uuid.uuid4()
+    user_id = ids[0]
     email = "admin@example.com"
     hashed_password = "hashed_password_string"
 
@@ -81,10 +81,10 @@ def test_user_admin_flag():
     assert user.is_admin is True
 
 
-def test_user_inactive_flag():
+def test_user_inactive_flag(ids):
     """Test that a user can be created as inactive."""
     # Arrange
-    user_id = uuid.uuid4()
+    user_id = ids[0]
     email = "inactive@example.com"
     hashed_password = "hashed_password_string"
 
@@ -100,10 +100,10 @@ def test_user_inactive_flag():
     assert user.is_active is False
 
 
-def test_user_invalid_email():
+def test_user_invalid_email(ids):
     """Test that a user cannot be created with an invalid email."""
     # Arrange
-    user_id = uuid.uuid4()
+    user_id = ids[0]
     invalid_email = "not_an_email"
     hashed_password = "hashed_password_string"
 
@@ -115,13 +115,13 @@ def test_user_invalid_email():
             hashed_password=hashed_password,
         )
 
-    assert "email" in str(exc_info.value)
+    assert "Invalid email address" in str(exc_info.value)
 
 
-def test_user_empty_email():
+def test_user_empty_email(ids):
     """Test that a user cannot be created with an empty email."""
     # Arrange
-    user_id = uuid.uuid4()
+    user_id = ids[0]
     empty_email = ""
     hashed_password = "hashed_password_string"
 
@@ -134,3 +134,36 @@ def test_user_empty_email():
         )
 
     assert "Email cannot be empty" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "email, message",
+    [
+        ("", "Email cannot be empty"),
+        ("   ", "Email cannot be empty"),
+        ("not_an_email", "Invalid email address"),
+        ("user@localhost", "Invalid email address"),
+        ("two@@example.com", "Invalid email address"),
+        ("with space@example.com", "Invalid email address"),
+    ],
+    ids=["empty", "whitespace", "no_at", "no_dot_in_domain", "double_at", "space"],
+)
+def test_user_email_validation_errors(ids, email, message):
+    """Test that malformed emails are rejected with a specific message."""
+    with pytest.raises(ValidationError, match=message):
+        User(id=ids[0], email=email, hashed_password="hashed_password_string")
+
+
+@pytest.mark.parametrize(
+    "email, expected",
+    [
+        ("User.Name@Example.COM", "User.Name@example.com"),
+        ("  user@example.com  ", "user@example.com"),
+    ],
+    ids=["domain_lowercased", "whitespace_stripped"],
+)
+def test_user_email_normalization(ids, email, expected):
+    """Test that the email domain is lowercased and whitespace stripped."""
+    user = User(id=ids[0], email=email, hashed_password="hashed_password_string")
+
+    assert user.email == expected
@@ -1,12 +1,6 @@
-"""Verify that domain entities are working correctly."""
+"""End-to-end construction checks for the domain entities."""
 
-import os
-import sys
-import uuid
-from datetime import datetime, timedelta
-
-# Add the project root to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+from datetime import timedelta
 
 from src.domain.entities.enums import EntityType
 from src.domain.entities.search_query import (
@@ -26,13 +20,10 @@ from src.domain.entities.thought import (
 from src.domain.entities.user import User
 
 
-def verify_thought():
-    """Verify that Thought entity works correctly."""
-    print("Verifying Thought entity...")
-
-    # Create a thought with minimal data
-    thought_id = uuid.uuid4()
-    user_id = uuid.uuid4()
+def test_verify_thought_minimal(ids):
+    """Verify that a Thought built from required fields gets its defaults."""
+    thought_id = ids[0]
+    user_id = ids[1]
     content = "This is a test thought"
 
     thought = Thought(
@@ -47,7 +38,9 @@ def verify_thought():
     assert isinstance(thought.metadata, ThoughtMetadata)
     assert thought.semantic_entries == []
 
-    # Create a thought with metadata
+
+def test_verify_thought_with_metadata(ids):
+    """Verify that a Thought keeps the metadata it is given."""
     location = GeoLocation(
         latitude=37.7749,
         longitude=-122.4194,
@@ -69,9 +62,9 @@ def verify_thought():
     )
 
     thought = Thought(
-        id=thought_id,
-        user_id=user_id,
-        content=content,
+        id=ids[0],
+        user_id=ids[1],
+        content="This is a test thought",
         metadata=metadata,
     )
 
@@ -81,16 +74,12 @@ def verify_thought():
     assert thought.metadata.tags == ["test", "metadata"]
     assert thought.metadata.custom == {"key1": "value1", "key2": "value2"}
 
-    print("Thought entity verification successful!")
-
 
-def verify_semantic_entry():
+def test_verify_semantic_entry(ids):
     """Verify that SemanticEntry entity works correctly."""
-    print("Verifying SemanticEntry entity...")
-
     # Create a semantic entry with minimal data
-    entry_id = uuid.uuid4()
-    thought_id = uuid.uuid4()
+    entry_id = ids[0]
+    thought_id = ids[1]
     entity_type = EntityType.PERSON
     entity_value = "John Doe"
     confidence = 0.95
@@ -115,9 +104,9 @@ def verify_semantic_entry():
 
     # Create a semantic entry with relationships
     relationship = Relationship(
-        id=uuid.uuid4(),
+        id=ids[2],
         source_entity_id=entry_id,
-        target_entity_id=uuid.uuid4(),
+        target_entity_id=ids[3],
         relationship_type="mentions",
         strength=0.8,
     )
@@ -135,15 +124,11 @@ def verify_semantic_entry():
     assert len(semantic_entry.relationships) == 1
     assert semantic_entry.relationships[0] == relationship
 
-    print("SemanticEntry entity verification successful!")
 
-
-def verify_user():
+def test_verify_user(ids, now):
     """Verify that User entity works correctly."""
-    print("Verifying User entity...")
-
     # Create a user with minimal data
-    user_id = uuid.uuid4()
+    user_id = ids[0]
     email = "test@example.com"
     hashed_password = "hashed_password_string"
 
@@ -160,35 +145,26 @@ def verify_user():
     assert user.is_admin is False
 
     # Create a user with all data
-    created_at = datetime.now()
-    updated_at = datetime.now()
-    last_login = datetime.now()
-
     user = User(
         id=user_id,
         email=email,
         hashed_password=hashed_password,
         is_active=False,
         is_admin=True,
-        created_at=created_at,
-        updated_at=updated_at,
-        last_login=last_login,
+        created_at=now,
+        updated_at=now,
+        last_login=now,
     )
 
     assert user.is_active is False
     assert user.is_admin is True
-    assert user.created_at == created_at
-    assert user.updated_at == updated_at
-    assert user.last_login == last_login
-
-    print("User entity verification successful!")
-
+    assert user.created_at == now
+    assert user.updated_at == now
+    assert user.last_login == now
 
-def verify_search_query():
-    """Verify that SearchQuery entity works correctly."""
-    print("Verifying SearchQuery entity...")
 
-    # Create a search query with minimal data
+def test_verify_search_query_minimal():
+    """Verify that a SearchQuery built from required fields gets its defaults."""
     query_text = "test query"
     user_id = "user123"
 
@@ -206,10 +182,12 @@ def verify_search_query():
     assert search_query.include_raw_content is True
     assert search_query.highlight_matches is True
 
-    # Create a search query with all data
+
+def test_verify_search_query_all_options(now):
+    """Verify that a SearchQuery keeps every option it is given."""
     date_range = DateRange(
-        start_date=datetime.now() - timedelta(days=7),
-        end_date=datetime.now(),
+        start_date=now - timedelta(days=7),
+        end_date=now,
     )
 
     entity_filter = EntityFilter(
@@ -228,8 +206,8 @@ def verify_search_query():
     )
 
     search_query = SearchQuery(
-        query_text=query_text,
-        user_id=user_id,
+        query_text="test query",
+        user_id="user123",
         date_range=date_range,
         entity_filter=entity_filter,
         sort_options=sort_options,
@@ -244,17 +222,3 @@ def verify_search_query():
     assert search_query.pagination == pagination
     assert search_query.include_raw_content is False
     assert search_query.highlight_matches is False
-
-    print("SearchQuery entity verification successful!")
-
-
-if __name__ == "__main__":
-    try:
-        verify_thought()
-        verify_semantic_entry()
-        verify_user()
-        verify_search_query()
-        print("\nAll domain entities verified successfully!")
-    except Exception as e:
-        print(f"\nVerification failed: {e}")
-        sys.exit(1)
@@ -1,10 +1,9 @@
 """Unit tests for the LLM-based entity extraction service."""
 
 import json
-import os
 import uuid
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -12,44 +11,52 @@ from src.domain.entities.enums import EntityType
 from src.domain.entities.semantic_entry import SemanticEntry
 from src.domain.entities.thought import ThoughtMetadata
 from src.domain.exceptions import EntityExtractionError
-from src.infrastructure.llm.entity_extraction_service import LLMEntityExtractionService
-from src.infrastructure.llm.llm_service import LLMService
+
+# The LLM modules pull in litellm, so they are imported inside the fixtures;
+# collecting or deselecting this module does not pay for that import.
+if TYPE_CHECKING:
+    from src.infrastructure.llm.entity_extraction_service import (
+        LLMEntityExtractionService,
+    )
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+SYSTEM_PROMPT = "System prompt"
+EXTRACTION_PROMPT = "Extract entities from: {CONTENT}\nMetadata: {METADATA}"
+EXTRACTION_SCHEMA = {"type": "object", "properties": {"entities": {"type": "array"}}}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_llm_service():
-    """Create a mock LLM service."""
+    """Create a mock LLM service shared by the module's tests."""
+    from src.infrastructure.llm.llm_service import LLMService
+
     mock = AsyncMock(spec=LLMService)
     return mock
 
 
-@pytest.fixture
-def entity_extraction_service(mock_llm_service, tmp_path):
-    """Create an entity extraction service with a mock LLM service and temp prompts directory."""
-    # Create temporary prompts directory
-    prompts_dir = tmp_path / "prompts"
-    prompts_dir.mkdir()
+@pytest.fixture(autouse=True)
+def reset_llm_service(mock_llm_service):
+    """Clear calls and configured results left over from a previous test."""
+    mock_llm_service.reset_mock(return_value=True, side_effect=True)
 
-    # Create system prompt file
-    system_prompt_file = prompts_dir / "entity_extraction_system.txt"
-    system_prompt_file.write_text("System prompt")
 
-    # Create extraction prompt file
-    extraction_prompt_file = prompts_dir / "entity_extraction.txt"
-    extraction_prompt_file.write_text(
-        "Extract entities from: {CONTENT}\nMetadata: {METADATA}"
+@pytest.fixture(scope="module")
+def entity_extraction_service(mock_llm_service) -> "LLMEntityExtractionService":
+    """Create an entity extraction service with a mock LLM service and in-memory prompts."""
+    from src.infrastructure.llm.entity_extraction_service import (
+        LLMEntityExtractionService,
+        PromptSet,
     )
 
-    # Create schema file
-    schema_file = prompts_dir / "entity_extraction_schema.json"
-    schema_file.write_text(
-        '{"type": "object", "properties": {"entities": {"type": "array"}}}'
+    prompts = PromptSet(
+        system_prompt=SYSTEM_PROMPT,
+        extraction_prompt=EXTRACTION_PROMPT,
+        extraction_schema=EXTRACTION_SCHEMA,
     )
-
-    return LLMEntityExtractionService(mock_llm_service, str(prompts_dir))
+    return LLMEntityExtractionService(mock_llm_service, prompts=prompts)
 
 
-@pytest.mark.asyncio
 async def test_extract_entities(mock_llm_service, entity_extraction_service):
     """Test extracting entities from text."""
     # Arrange
@@ -128,9 +135,84 @@ async def test_extract_entities(mock_llm_service, entity_extraction_service):
     assert "{CONTENT}" not in call_args[1]["prompt"]
     assert content in call_args[1]["prompt"]
     assert call_args[1]["json_mode"] is True
+    assert call_args[1]["parse_json"] is False
+
+
+async def test_extract_entities_from_raw_json(
+    mock_llm_service, entity_extraction_service
+):
+    """Test extracting entities from the raw JSON text the LLM returns."""
+    # Arrange
+    thought_id = uuid.uuid4()
+    mock_llm_service.generate.return_value = json.dumps(
+        {
+            "entities": [
+                {
+                    "id": "1",
+                    "type": "PERSON",
+                    "value": "John",
+                    "confidence": 0.95,
+                    "context": "John met Sarah",
+                    "relationships": [
+                        {"target_id": "2", "type": "met_with", "strength": 0.7}
+                    ],
+                },
+                {"id": "2", "type": "person", "value": "Sarah"},
+                {"id": "3", "type": "INVALID_TYPE", "value": "Ignored"},
+            ]
+        }
+    )
+
+    # Act
+    result = await entity_extraction_service.extract_entities(
+        "John met Sarah.", thought_id
+    )
+
+    # Assert
+    assert [entry.entity_value for entry in result] == ["John", "Sarah"]
+    assert all(entry.thought_id == thought_id for entry in result)
+    assert all(entry.entity_type == EntityType.PERSON for entry in result)
+
+    john, sarah = result
+    assert john.confidence == 0.95
+    assert john.context == "John met Sarah"
+    assert sarah.confidence == 0.9
+    assert sarah.context == ""
+    assert sarah.relationships == []
+
+    (relationship,) = john.relationships
+    assert relationship.source_entity_id == john.id
+    assert relationship.target_entity_id == sarah.id
+    assert relationship.relationship_type == "met_with"
+    assert relationship.strength == 0.7
+
+
+async def test_extract_entities_from_raw_json_with_numeric_ids(
+    mock_llm_service, entity_extraction_service
+):
+    """Test that numeric temporary IDs in raw JSON still link relationships."""
+    # Arrange
+    mock_llm_service.generate.return_value = (
+        b'{"entities": ['
+        b'{"id": 1, "type": "PERSON", "value": "John",'
+        b' "relationships": [{"target_id": 2}]},'
+        b'{"id": 2, "type": "LOCATION", "value": "New York"}'
+        b"]}"
+    )
+
+    # Act
+    result = await entity_extraction_service.extract_entities(
+        "John is in New York.", uuid.uuid4()
+    )
+
+    # Assert
+    john, new_york = result
+    (relationship,) = john.relationships
+    assert relationship.target_entity_id == new_york.id
+    assert relationship.relationship_type == "related_to"
+    assert relationship.strength == 0.9
 
 
-@pytest.mark.asyncio
 async def test_extract_entities_with_metadata(
     mock_llm_service, entity_extraction_service
 ):
@@ -170,7 +252,6 @@ async def test_extract_entities_with_metadata(
     assert "vacation" in call_args[1]["prompt"]
 
 
-@pytest.mark.asyncio
 async def test_extract_entities_llm_error(mock_llm_service, entity_extraction_service):
     """Test handling LLM errors during extraction."""
     # Arrange
@@ -183,7 +264,6 @@ async def test_extract_entities_llm_error(mock_llm_service, entity_extraction_se
         await entity_extraction_service.extract_entities(content, thought_id)
 
 
-@pytest.mark.asyncio
 async def test_extract_entities_invalid_response(
     mock_llm_service, entity_extraction_service
 ):
@@ -191,7 +271,7 @@ async def test_extract_entities_invalid_response(
     # Arrange
     thought_id = uuid.uuid4()
     content = "Test content"
-    mock_llm_service.generate.return_value = {"invalid": "response"}
+    mock_llm_service.generate.return_value = b'{"invalid": "response"}'
 
     # Act
     result = await entity_extraction_service.extract_entities(content, thought_id)
@@ -200,7 +280,6 @@ async def test_extract_entities_invalid_response(
     assert len(result) == 0
 
 
-@pytest.mark.asyncio
 async def test_extract_entities_invalid_entity_type(
     mock_llm_service, entity_extraction_service
 ):
@@ -222,3 +301,56 @@ async def test_extract_entities_invalid_entity_type(
     assert len(result) == 1
     assert result[0].entity_type == EntityType.PERSON
     assert result[0].entity_value == "John"
+
+
+async def test_extract_entities_with_prompts_dir(mock_llm_service, tmp_path):
+    """Test that prompt templates are loaded from a prompts directory."""
+    from src.infrastructure.llm.entity_extraction_service import (
+        LLMEntityExtractionService,
+    )
+
+    # Arrange
+    (tmp_path / "entity_extraction_system.txt").write_text(SYSTEM_PROMPT)
+    (tmp_path / "entity_extraction.txt").write_text(EXTRACTION_PROMPT)
+    (tmp_path / "entity_extraction_schema.json").write_text(
+        json.dumps(EXTRACTION_SCHEMA)
+    )
+    service = LLMEntityExtractionService(mock_llm_service, str(tmp_path))
+    mock_llm_service.generate.return_value = {"entities": []}
+
+    # Act
+    await service.extract_entities("Test content", uuid.uuid4())
+
+    # Assert
+    call_args = mock_llm_service.generate.call_args
+    assert call_args[1]["system_prompt"] == SYSTEM_PROMPT
+    assert call_args[1]["prompt"] == "Extract entities from: Test content\nMetadata: {}"
+    assert call_args[1]["json_schema"] == EXTRACTION_SCHEMA
+
+
+async def test_extract_entities_keeps_literal_braces(mock_llm_service):
+    """Test that braces other than the placeholders are left in the prompt."""
+    from src.infrastructure.llm.entity_extraction_service import (
+        LLMEntityExtractionService,
+        PromptSet,
+    )
+
+    # Arrange
+    template = (
+        'Return JSON like {"entities": []} or {} or {{escaped}}.\n'
+        "Text: {CONTENT}\nMetadata: {METADATA}\nUnknown: {OTHER}"
+    )
+    service = LLMEntityExtractionService(
+        mock_llm_service, prompts=PromptSet(extraction_prompt=template)
+    )
+    mock_llm_service.generate.return_value = {"entities": []}
+
+    # Act
+    await service.extract_entities("Mentions {METADATA} literally", uuid.uuid4())
+
+    # Assert
+    prompt = mock_llm_service.generate.call_args[1]["prompt"]
+    assert prompt == (
+        'Return JSON like {"entities": []} or {} or {{escaped}}.\n'
+        "Text: Mentions {METADATA} literally\nMetadata: {}\nUnknown: {OTHER}"
+    )
@@ -10,6 +10,8 @@ from src.domain.exceptions import EntityExtractionError
 from src.infrastructure.llm.config import LLMConfigLoader
 from src.infrastructure.llm.llm_service import LLMService
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 @pytest.fixture
 def mock_config_loader():
@@ -29,7 +31,6 @@ def llm_service(mock_config_loader):
     return LLMService(config_loader=mock_config_loader)
 
 
-@pytest.mark.asyncio
 @patch("src.infrastructure.llm.llm_service.completion")
 async def test_generate_text(mock_completion, llm_service):
     """Test generating text from the LLM."""
@@ -52,7 +53,6 @@ async def test_generate_text(mock_completion, llm_service):
     )
 
 
-@pytest.mark.asyncio
 @patch("src.infrastructure.llm.llm_service.completion")
 async def test_generate_with_system_prompt(mock_completion, llm_service):
     """Test generating text with a system prompt."""
@@ -80,7 +80,6 @@ async def test_generate_with_system_prompt(mock_completion, llm_service):
     )
 
 
-@pytest.mark.asyncio
 @patch("src.infrastructure.llm.llm_service.completion")
 async def test_generate_json(mock_completion, llm_service):
     """Test generating JSON from the LLM."""
@@ -103,7 +102,6 @@ async def test_generate_json(mock_completion, llm_service):
     )
 
 
-@pytest.mark.asyncio
 @patch("src.infrastructure.llm.llm_service.completion")
 async def test_generate_json_with_schema(mock_completion, llm_service):
     """Test generating JSON with a schema."""
@@ -130,7 +128,24 @@ async def test_generate_json_with_schema(mock_completion, llm_service):
     )
 
 
-@pytest.mark.asyncio
+@patch("src.infrastructure.llm.llm_service.completion", new_callable=AsyncMock)
+async def test_generate_json_unparsed(mock_completion, llm_service):
+    """Test that parse_json=False returns the raw JSON text."""
+    # Arrange
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = '{"key": "value"}'
+    mock_completion.return_value = mock_response
+
+    # Act
+    result = await llm_service.generate(
+        "Test prompt", json_mode=True, parse_json=False
+    )
+
+    # Assert
+    assert result == '{"key": "value"}'
+    mock_completion.assert_awaited_once()
+
+
 @patch("src.infrastructure.llm.llm_service.completion")
 async def test_generate_json_invalid_response(mock_completion, llm_service):
     """Test handling invalid JSON response."""
@@ -144,7 +159,6 @@ async def test_generate_json_invalid_response(mock_completion, llm_service):
         await llm_service.generate("Test prompt", json_mode=True)
 
 
-@pytest.mark.asyncio
 @patch("src.infrastructure.llm.llm_service.completion")
 async def test_generate_api_error(mock_completion, llm_service):
     """Test handling API errors."""
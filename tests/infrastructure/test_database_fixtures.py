@@ -0,0 +1,34 @@
+"""Tests for the shared database connection and savepoint session fixtures."""
+
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select
+
+from src.infrastructure.database.models import User as UserModel
+
+# db_connection and db_session live on the session event loop.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+USER_ID = UUID("11111111-1111-1111-1111-111111111111")
+
+
+async def test_db_session_commit_keeps_outer_transaction_open(
+    db_connection, db_session
+):
+    """Test that a commit in the test only releases the savepoint."""
+    db_session.add(
+        UserModel(id=USER_ID, email="fixture@example.com", hashed_password="hashed")
+    )
+    await db_session.commit()
+
+    assert db_connection.in_transaction()
+    saved = await db_session.scalar(select(UserModel).where(UserModel.id == USER_ID))
+    assert saved.email == "fixture@example.com"
+
+
+async def test_db_session_starts_without_rows_from_other_tests(db_session):
+    """Test that the outer transaction is rolled back after each test."""
+    saved = await db_session.scalar(select(UserModel).where(UserModel.id == USER_ID))
+
+    assert saved is None